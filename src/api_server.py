@@ -1,6 +1,7 @@
 """FastAPI server exposing user profile data for the browser extension."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -19,6 +20,9 @@ app.add_middleware(
 
 PROFILE_PATH = Path(__file__).parent.parent / "templates" / "user_profile.yaml"
 
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @app.get("/api/health")
 def health():
@@ -27,8 +31,14 @@ def health():
 
 @app.get("/api/profile")
 def get_profile():
-    with open(PROFILE_PATH, "r", encoding="utf-8") as f:
-        profile = yaml.safe_load(f)
+    return load_profile_data(str(PROFILE_PATH), PROFILE_PATH.stat().st_mtime)
+
+
+@lru_cache(maxsize=1)
+def load_profile_data(path: str, mtime: float) -> dict:
+    """Map the profile YAML to the extension's ProfileData, cached until the file's modification time changes."""
+    with open(path, "r", encoding="utf-8") as f:
+        profile = yaml.load(f, Loader=YAML_LOADER)
 
     personal_info = profile.get("personal_info", {})
     urls = profile.get("urls", {})
@@ -3,8 +3,10 @@ Cost tracking utility for OpenAI API calls.
 Tracks token usage and calculates costs based on current OpenAI pricing (2024).
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
 
@@ -24,6 +26,7 @@ class APICallCost:
 class CostTracker:
     """Tracks cumulative API costs for a session."""
     calls: List[APICallCost] = field(default_factory=list)
+    cache_hits: List[str] = field(default_factory=list)  # operations served from the response cache
 
     # Current OpenAI pricing - prices per 1M tokens
     PRICING = {
@@ -130,6 +133,15 @@ class CostTracker:
         self.calls.append(call_cost)
         return call_cost
 
+    def add_cache_hit(self, operation: str) -> None:
+        """
+        Record an operation answered from the response cache instead of the API.
+
+        Args:
+            operation: Type of operation (job_parsing, skills_matching, etc.)
+        """
+        self.cache_hits.append(operation)
+
     @property
     def total_cost(self) -> float:
         """Get total cost of all API calls."""
@@ -229,10 +241,34 @@ class CostTracker:
 # Global cost tracker instance
 _global_tracker = CostTracker()
 
+# Tracker of the generation running in the current context, if any
+_generation_tracker: ContextVar[Optional[CostTracker]] = ContextVar("generation_tracker", default=None)
+
 
 def get_cost_tracker() -> CostTracker:
-    """Get the global cost tracker instance."""
-    return _global_tracker
+    """Get the tracker of the current generation, or the global cost tracker instance."""
+    tracker = _generation_tracker.get()
+    return _global_tracker if tracker is None else tracker
+
+
+@contextmanager
+def generation_cost_tracker() -> Iterator[CostTracker]:
+    """
+    Record the API calls made in this context in a tracker of their own.
+
+    Generations running concurrently on different threads then keep their costs
+    apart. Work handed to other threads must run in a copy of this context
+    (contextvars.copy_context().run) to be recorded too. The calls are added to
+    the global tracker on exit.
+    """
+    tracker = CostTracker()
+    token = _generation_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _generation_tracker.reset(token)
+        _global_tracker.calls.extend(tracker.calls)
+        _global_tracker.cache_hits.extend(tracker.cache_hits)
 
 
 def reset_cost_tracker():
@@ -1,10 +1,28 @@
 import sqlite3
 import json
+from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_skills(skills: List[str]) -> str:
+    """Serialize a skill list to JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(skills).decode("utf-8")
+    return json.dumps(skills)
+
+
+# orjson parses str input directly and is several times faster than the json module
+_load_skills = orjson.loads if orjson is not None else json.loads
+
 
 class Application(BaseModel):
     id: Optional[int] = None
@@ -22,14 +40,173 @@ class Application(BaseModel):
     cover_letter_pdf: Optional[bytes] = None
 
 
+# Per-connection tuning: WAL-friendly sync level, in-memory temp tables,
+# memory-mapped reads (256 MB) and a 64 MB page cache
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+# Trigger bodies keeping skill_counts in step with applications.unmatched_skills;
+# {skills} is the NEW/OLD column the statements apply to
+SKILL_COUNTS_ADD_SQL = """
+    INSERT INTO skill_counts (skill, unmatched_count)
+    SELECT value, COUNT(*) FROM json_each({skills}) WHERE true GROUP BY value
+    ON CONFLICT(skill) DO UPDATE SET unmatched_count = unmatched_count + excluded.unmatched_count;
+"""
+SKILL_COUNTS_REMOVE_SQL = """
+    UPDATE skill_counts
+    SET unmatched_count = unmatched_count - (SELECT COUNT(*) FROM json_each({skills}) WHERE value = skill)
+    WHERE skill IN (SELECT value FROM json_each({skills}));
+    DELETE FROM skill_counts WHERE unmatched_count <= 0;
+"""
+
+# Every column except the PDF blobs, for listings that do not need the documents
+APPLICATION_COLUMNS_WITHOUT_PDFS = (
+    "id, company, position, matching_rate, unmatched_skills, matched_skills, "
+    "location, job_offer_input, application_cost, language, created_at"
+)
+
+# Columns of the lightweight listing rows: no JSON to decode and no PDF blobs
+APPLICATION_SUMMARY_COLUMNS = (
+    "id, company, position, location, matching_rate, matched_count, unmatched_count, "
+    "application_cost, created_at"
+)
+
+# Whitelisted ORDER BY clauses for application listings, each backed by an index
+APPLICATION_ORDERINGS = {
+    "newest": "created_at DESC",
+    "oldest": "created_at ASC",
+    "match_desc": "matching_rate DESC, created_at DESC",
+    "match_asc": "matching_rate ASC, created_at DESC",
+    "cost_desc": "application_cost DESC, created_at DESC",
+    "company": "company ASC, created_at DESC",
+}
+
+# Application fields written by save_applications, fetched in one call per row
+_application_fields = attrgetter(
+    "company", "position", "matching_rate", "unmatched_skills", "matched_skills", "location",
+    "job_offer_input", "application_cost", "language", "cv_pdf", "cover_letter_pdf"
+)
+
+# Write statements are kept as constants so every call hits the
+# connection's prepared-statement cache with an identical SQL string
+SELECT_APPLICATION_ID_SQL = "SELECT id FROM applications WHERE company = ? AND position = ?"
+
+UPDATE_APPLICATION_SQL = """
+    UPDATE applications
+    SET matching_rate = ?, unmatched_skills = ?, matched_skills = ?,
+        matched_count = ?, unmatched_count = ?,
+        location = ?, job_offer_input = ?, application_cost = ?, language = ?,
+        cv_pdf = ?, cover_letter_pdf = ?,
+        created_at = CURRENT_TIMESTAMP
+    WHERE company = ? AND position = ?
+"""
+
+INSERT_APPLICATION_SQL = """
+    INSERT INTO applications
+    (company, position, matching_rate, unmatched_skills, matched_skills, matched_count, unmatched_count,
+     location, job_offer_input, application_cost, language, cv_pdf, cover_letter_pdf)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# One fixed statement per document type, so the lookup needs no SQL formatting
+SELECT_PDF_SQL = {
+    "cv": "SELECT cv_pdf FROM applications WHERE id = ?",
+    "cover_letter": "SELECT cover_letter_pdf FROM applications WHERE id = ?",
+}
+
+
+# Drops the documents of applications older than the bound age modifier
+# (e.g. "-90 days"); a bound value keeps the statement text constant
+CLEANUP_OLD_PDFS_SQL = """
+    UPDATE applications
+    SET cv_pdf = NULL, cover_letter_pdf = NULL
+    WHERE created_at < datetime('now', ?)
+    AND (cv_pdf IS NOT NULL OR cover_letter_pdf IS NOT NULL)
+"""
+
+
 class ApplicationDatabase:
-    def __init__(self, db_path: str = "applications.db"):
+    def __init__(self, db_path: str = "applications.db", uri: bool = False,
+                 connection: Optional[sqlite3.Connection] = None):
+        # uri=True treats db_path as an SQLite URI, e.g. a shared in-memory
+        # database "file:name?mode=memory&cache=shared"
         self.db_path = Path(db_path)
+        self.uri = uri
+        # A caller-owned connection reused by every call instead of opening
+        # one per call; only for single-threaded use such as tests or scripts
+        self._connection = connection
+        if connection is not None:
+            for pragma in CONNECTION_PRAGMAS:
+                connection.execute(pragma)
         self.init_database()
 
+    @contextmanager
+    def _connect(self):
+        """
+        Open a tuned connection, commit (or roll back) on exit and close it.
+
+        PRAGMA optimize is run before closing, as recommended by SQLite for
+        short-lived connections, so planner statistics stay fresh. When a
+        connection was passed in, it is reused and left open instead, keeping
+        its prepared-statement cache across calls; its row factory is restored
+        afterwards, and a transaction the caller already opened is left for
+        the caller to commit or roll back.
+        """
+        if self._connection is not None:
+            conn = self._connection
+            row_factory = conn.row_factory
+            conn.row_factory = None
+            try:
+                if conn.in_transaction:
+                    yield conn
+                else:
+                    with conn:
+                        yield conn
+            finally:
+                conn.row_factory = row_factory
+            return
+
+        conn = sqlite3.connect(self.db_path, uri=self.uri, cached_statements=256)
+        try:
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            with conn:
+                yield conn
+            conn.execute("PRAGMA optimize")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_application(row: sqlite3.Row) -> Application:
+        """Convert a database row into an Application model"""
+        row_dict = dict(row)
+        return Application(
+            id=row_dict['id'],
+            company=row_dict['company'],
+            position=row_dict['position'],
+            matching_rate=row_dict['matching_rate'],
+            unmatched_skills=_load_skills(row_dict['unmatched_skills']),
+            matched_skills=_load_skills(row_dict['matched_skills']),
+            location=row_dict['location'],
+            job_offer_input=row_dict['job_offer_input'],
+            application_cost=row_dict['application_cost'],
+            language=row_dict.get('language', 'en'),
+            created_at=datetime.fromisoformat(row_dict['created_at']),
+            cv_pdf=row_dict.get('cv_pdf'),
+            cover_letter_pdf=row_dict.get('cover_letter_pdf')
+        )
+
     def init_database(self):
         """Initialize the SQLite database and create tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL lets the dashboard read while an application is being saved;
+            # the journal mode is persistent, so it only needs setting here
+            conn.execute("PRAGMA journal_mode = WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS applications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -73,123 +250,244 @@ class ApplicationDatabase:
                 # Column already exists
                 pass
 
+            # Skill counts stored alongside the JSON lists so listings never decode them
+            for column in ("matched_count", "unmatched_count"):
+                try:
+                    conn.execute(f"ALTER TABLE applications ADD COLUMN {column} INTEGER")
+                except sqlite3.OperationalError:
+                    # Column already exists
+                    pass
+            conn.execute("""
+                UPDATE applications
+                SET matched_count = json_array_length(matched_skills),
+                    unmatched_count = json_array_length(unmatched_skills)
+                WHERE matched_count IS NULL OR unmatched_count IS NULL
+            """)
+
+            # Running per-skill totals of unmatched skills, kept current by triggers so
+            # the skills gap chart never re-aggregates every application's JSON list
+            has_skill_counts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'skill_counts'"
+            ).fetchone() is not None
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS skill_counts (
+                    skill TEXT PRIMARY KEY,
+                    unmatched_count INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_skill_counts_freq ON skill_counts(unmatched_count DESC, skill)"
+            )
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_skill_counts_insert AFTER INSERT ON applications
+                BEGIN
+                    {SKILL_COUNTS_ADD_SQL.format(skills="NEW.unmatched_skills")}
+                END
+            """)
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_skill_counts_delete AFTER DELETE ON applications
+                BEGIN
+                    {SKILL_COUNTS_REMOVE_SQL.format(skills="OLD.unmatched_skills")}
+                END
+            """)
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_skill_counts_update AFTER UPDATE OF unmatched_skills ON applications
+                WHEN OLD.unmatched_skills IS NOT NEW.unmatched_skills
+                BEGIN
+                    {SKILL_COUNTS_REMOVE_SQL.format(skills="OLD.unmatched_skills")}
+                    {SKILL_COUNTS_ADD_SQL.format(skills="NEW.unmatched_skills")}
+                END
+            """)
+            if not has_skill_counts:
+                # First run on an existing database: count the applications saved so far
+                conn.execute("""
+                    INSERT INTO skill_counts (skill, unmatched_count)
+                    SELECT skills.value, COUNT(*)
+                    FROM applications, json_each(applications.unmatched_skills) AS skills
+                    GROUP BY skills.value
+                """)
+
+            # Indexes matching the dashboard access patterns (filter by company /
+            # match rate, newest first) so SQLite avoids full scans and temp sorts
+            existing_indexes = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_created ON applications(created_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_cov ON applications(company, matching_rate, created_at DESC)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_apps_highmatch ON applications(created_at DESC) "
+                "WHERE matching_rate >= 0.5"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_rate ON applications(matching_rate)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_cost ON applications(application_cost)")
+            if not {"idx_apps_created", "idx_apps_cov", "idx_apps_highmatch",
+                    "idx_apps_rate", "idx_apps_cost"} <= existing_indexes:
+                # Refresh planner statistics once, when the indexes are first created
+                conn.execute("ANALYZE")
+
             conn.commit()
 
+    @staticmethod
+    def _upsert_application(conn: sqlite3.Connection, application: Application) -> int:
+        """Insert an application, or overwrite the one with the same company and position"""
+        (company, position, matching_rate, unmatched_skills, matched_skills, location,
+         job_offer_input, application_cost, language, cv_pdf, cover_letter_pdf) = _application_fields(application)
+        key = (company, position)
+        # Column values shared by the UPDATE and the INSERT, in statement order
+        values = (
+            matching_rate,
+            _dump_skills(unmatched_skills),
+            _dump_skills(matched_skills),
+            len(matched_skills),
+            len(unmatched_skills),
+            location,
+            job_offer_input,
+            application_cost,
+            language,
+            cv_pdf,
+            cover_letter_pdf
+        )
+
+        # First, check if an application with the same company and position exists
+        existing = conn.execute(SELECT_APPLICATION_ID_SQL, key).fetchone()
+        if existing:
+            # Update existing record
+            conn.execute(UPDATE_APPLICATION_SQL, values + key)
+            return existing[0]  # Return the existing ID
+
+        # Insert new record
+        return conn.execute(INSERT_APPLICATION_SQL, key + values).lastrowid
+
     def save_application(self, application: Application) -> int:
         """Save a new application to the database or overwrite if company and position match"""
-        with sqlite3.connect(self.db_path) as conn:
-            # First, check if an application with the same company and position exists
-            cursor = conn.execute("""
-                SELECT id FROM applications WHERE company = ? AND position = ?
-            """, (application.company, application.position))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing record
-                cursor = conn.execute("""
-                    UPDATE applications
-                    SET matching_rate = ?, unmatched_skills = ?, matched_skills = ?,
-                        location = ?, job_offer_input = ?, application_cost = ?, language = ?,
-                        cv_pdf = ?, cover_letter_pdf = ?,
-                        created_at = CURRENT_TIMESTAMP
-                    WHERE company = ? AND position = ?
-                """, (
-                    application.matching_rate,
-                    json.dumps(application.unmatched_skills),
-                    json.dumps(application.matched_skills),
-                    application.location,
-                    application.job_offer_input,
-                    application.application_cost,
-                    application.language,
-                    application.cv_pdf,
-                    application.cover_letter_pdf,
-                    application.company,
-                    application.position
-                ))
-                conn.commit()
-                return existing[0]  # Return the existing ID
-            else:
-                # Insert new record
-                cursor = conn.execute("""
-                    INSERT INTO applications
-                    (company, position, matching_rate, unmatched_skills, matched_skills, location, job_offer_input, application_cost, language, cv_pdf, cover_letter_pdf)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    application.company,
-                    application.position,
-                    application.matching_rate,
-                    json.dumps(application.unmatched_skills),
-                    json.dumps(application.matched_skills),
-                    application.location,
-                    application.job_offer_input,
-                    application.application_cost,
-                    application.language,
-                    application.cv_pdf,
-                    application.cover_letter_pdf
-                ))
-                conn.commit()
-                return cursor.lastrowid
-
-    def get_application(self, application_id: int) -> Optional[Application]:
-        """Retrieve an application by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        return self.save_applications([application])[0]
+
+    def save_applications(self, applications: List[Application]) -> List[int]:
+        """Save several applications in one transaction, returning their IDs in order"""
+        with self._connect() as conn:
+            # Take the write lock up front so the lookups and the writes are atomic;
+            # inside a caller's transaction they are already part of it
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            return [self._upsert_application(conn, application) for application in applications]
+
+    def get_application(self, application_id: int, include_pdfs: bool = True) -> Optional[Application]:
+        """Retrieve an application by ID, optionally without reading its PDF blobs"""
+        columns = "*" if include_pdfs else APPLICATION_COLUMNS_WITHOUT_PDFS
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM applications WHERE id = ?
+            cursor = conn.execute(f"""
+                SELECT {columns} FROM applications WHERE id = ?
             """, (application_id,))
             row = cursor.fetchone()
 
-            if row:
-                row_dict = dict(row)
-                return Application(
-                    id=row_dict['id'],
-                    company=row_dict['company'],
-                    position=row_dict['position'],
-                    matching_rate=row_dict['matching_rate'],
-                    unmatched_skills=json.loads(row_dict['unmatched_skills']),
-                    matched_skills=json.loads(row_dict['matched_skills']),
-                    location=row_dict['location'],
-                    job_offer_input=row_dict['job_offer_input'],
-                    application_cost=row_dict['application_cost'],
-                    language=row_dict.get('language', 'en'),
-                    created_at=datetime.fromisoformat(row_dict['created_at']),
-                    cv_pdf=row_dict.get('cv_pdf'),
-                    cover_letter_pdf=row_dict.get('cover_letter_pdf')
-                )
-            return None
+            return self._row_to_application(row) if row else None
 
     def get_all_applications(self) -> List[Application]:
         """Retrieve all applications from the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT * FROM applications ORDER BY created_at DESC
             """)
             rows = cursor.fetchall()
 
-            applications = []
-            for row in rows:
-                row_dict = dict(row)
-                applications.append(Application(
-                    id=row_dict['id'],
-                    company=row_dict['company'],
-                    position=row_dict['position'],
-                    matching_rate=row_dict['matching_rate'],
-                    unmatched_skills=json.loads(row_dict['unmatched_skills']),
-                    matched_skills=json.loads(row_dict['matched_skills']),
-                    location=row_dict['location'],
-                    job_offer_input=row_dict['job_offer_input'],
-                    application_cost=row_dict['application_cost'],
-                    language=row_dict.get('language', 'en'),
-                    created_at=datetime.fromisoformat(row_dict['created_at']),
-                    cv_pdf=row_dict.get('cv_pdf'),
-                    cover_letter_pdf=row_dict.get('cover_letter_pdf')
-                ))
-            return applications
+            return [self._row_to_application(row) for row in rows]
+
+    def get_applications(self, limit: Optional[int] = None, offset: int = 0,
+                         company: Optional[str] = None, include_pdfs: bool = True,
+                         min_rate: float = 0.0, order_by: str = "newest") -> List[Application]:
+        """
+        Retrieve one page of applications, filtered and sorted in SQL.
+
+        Args:
+            limit: Maximum number of applications to return (None for all)
+            offset: Number of applications to skip
+            company: Only return applications for this company (None for all)
+            include_pdfs: Whether to load the stored PDF blobs (left as None otherwise)
+            min_rate: Only return applications with at least this matching rate
+            order_by: Key of APPLICATION_ORDERINGS (newest first by default)
+
+        Returns:
+            List of applications in the requested page
+        """
+        columns = "*" if include_pdfs else APPLICATION_COLUMNS_WITHOUT_PDFS
+        query, params = self._listing_query(columns, limit, offset, company, min_rate, order_by)
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, params)
+            rows = cursor.fetchall()
+
+            return [self._row_to_application(row) for row in rows]
+
+    def get_application_summaries(self, limit: Optional[int] = None, offset: int = 0,
+                                  company: Optional[str] = None, min_rate: float = 0.0,
+                                  order_by: str = "newest") -> List[dict]:
+        """
+        Retrieve one page of lightweight listing rows, filtered and sorted like get_applications().
+
+        Rows carry the stored skill counts instead of the skill lists, so nothing is
+        JSON-decoded and no PDF or job offer text is read.
+
+        Returns:
+            List of dicts with the APPLICATION_SUMMARY_COLUMNS keys (created_at as datetime)
+        """
+        query, params = self._listing_query(APPLICATION_SUMMARY_COLUMNS, limit, offset, company, min_rate, order_by)
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+
+        summaries = []
+        for row in rows:
+            summary = dict(row)
+            summary['created_at'] = datetime.fromisoformat(summary['created_at'])
+            summaries.append(summary)
+        return summaries
+
+    def get_application_count(self, company: Optional[str] = None, min_rate: float = 0.0) -> int:
+        """Get the number of applications, optionally filtered by company and minimum matching rate"""
+        where, params = self._filter_clause(company, min_rate)
+        with self._connect() as conn:
+            cursor = conn.execute(f"SELECT COUNT(*) FROM applications{where}", params)
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def _listing_query(cls, columns: str, limit: Optional[int], offset: int, company: Optional[str],
+                       min_rate: float, order_by: str) -> Tuple[str, list]:
+        """Build the filtered, ordered and paged SELECT shared by the listing methods"""
+        if order_by not in APPLICATION_ORDERINGS:
+            raise ValueError(f"Unsupported ordering: {order_by}")
+
+        where, params = cls._filter_clause(company, min_rate)
+        query = f"SELECT {columns} FROM applications{where} ORDER BY {APPLICATION_ORDERINGS[order_by]} LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+        return query, params
+
+    @staticmethod
+    def _filter_clause(company: Optional[str], min_rate: float) -> Tuple[str, list]:
+        """Build the WHERE clause and parameters shared by listings and counts"""
+        conditions = []
+        params: list = []
+        if company is not None:
+            conditions.append("company = ?")
+            params.append(company)
+        if min_rate > 0:
+            conditions.append("matching_rate >= ?")
+            params.append(min_rate)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def distinct_companies(self) -> List[str]:
+        """Get the sorted list of companies applied to (covering scan of idx_apps_cov)"""
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT DISTINCT company FROM applications ORDER BY company")
+            return [row[0] for row in cursor.fetchall()]
 
     def delete_application(self, application_id: int) -> bool:
         """Delete an application by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 DELETE FROM applications WHERE id = ?
             """, (application_id,))
@@ -198,43 +496,25 @@ class ApplicationDatabase:
 
     def get_applications_by_company(self, company: str) -> List[Application]:
         """Get all applications for a specific company"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT * FROM applications WHERE company = ? ORDER BY created_at DESC
             """, (company,))
             rows = cursor.fetchall()
 
-            applications = []
-            for row in rows:
-                row_dict = dict(row)
-                applications.append(Application(
-                    id=row_dict['id'],
-                    company=row_dict['company'],
-                    position=row_dict['position'],
-                    matching_rate=row_dict['matching_rate'],
-                    unmatched_skills=json.loads(row_dict['unmatched_skills']),
-                    matched_skills=json.loads(row_dict['matched_skills']),
-                    location=row_dict['location'],
-                    job_offer_input=row_dict['job_offer_input'],
-                    application_cost=row_dict['application_cost'],
-                    language=row_dict.get('language', 'en'),
-                    created_at=datetime.fromisoformat(row_dict['created_at']),
-                    cv_pdf=row_dict.get('cv_pdf'),
-                    cover_letter_pdf=row_dict.get('cover_letter_pdf')
-                ))
-            return applications
+            return [self._row_to_application(row) for row in rows]
 
     def get_total_cost(self) -> float:
         """Get total cost of all applications"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("SELECT SUM(application_cost) as total FROM applications")
             result = cursor.fetchone()
             return result[0] if result[0] is not None else 0.0
 
     def get_cost_by_date_range(self, start_date: datetime, end_date: datetime) -> float:
         """Get total cost within a date range"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT SUM(application_cost) as total
                 FROM applications
@@ -243,6 +523,108 @@ class ApplicationDatabase:
             result = cursor.fetchone()
             return result[0] if result[0] is not None else 0.0
 
+    def get_summary_since(self, start: Optional[datetime] = None) -> Tuple[int, float, float]:
+        """
+        Summarize the applications created since a point in time.
+
+        Uses a range scan of idx_apps_created instead of loading every application.
+
+        Args:
+            start: Earliest creation time to include (None for all applications)
+
+        Returns:
+            Tuple of (application count, total cost, average matching rate)
+        """
+        query = """
+            SELECT COUNT(*), COALESCE(SUM(application_cost), 0.0), COALESCE(AVG(matching_rate), 0.0)
+            FROM applications
+        """
+        params: tuple = ()
+        if start is not None:
+            query += " WHERE created_at >= ?"
+            params = (start.strftime('%Y-%m-%d %H:%M:%S'),)
+
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
+            return tuple(cursor.fetchone())
+
+    def get_daily_stats(self, start: datetime) -> List[Tuple[str, int, float]]:
+        """
+        Bucket the applications created since a point in time by day.
+
+        Only one row per day leaves the database, however many applications there are.
+
+        Args:
+            start: Earliest creation time to include
+
+        Returns:
+            List of (YYYY-MM-DD day, application count, average matching rate), oldest first
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("""
+                SELECT date(created_at) AS day, COUNT(*), AVG(matching_rate)
+                FROM applications
+                WHERE created_at >= ?
+                GROUP BY day
+                ORDER BY day
+            """, (start.strftime('%Y-%m-%d %H:%M:%S'),))
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def get_data_version(self) -> tuple:
+        """
+        Get a cheap fingerprint of the applications table.
+
+        Changes whenever an application is inserted, overwritten or deleted, so it
+        can be used as a cache key for data derived from the table.
+
+        Returns:
+            Tuple of (row count, max id, latest created_at)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT COUNT(*), MAX(id), MAX(created_at) FROM applications")
+            return tuple(cursor.fetchone())
+
+    def get_top_unmatched_skills(self, limit: int = 15) -> List[Tuple[str, int]]:
+        """
+        Get the most frequently unmatched skills across all applications.
+
+        Reads the skill_counts totals maintained by triggers, so the cost does not
+        grow with the number of applications.
+
+        Args:
+            limit: Maximum number of skills to return
+
+        Returns:
+            List of (skill, count) tuples sorted by count descending
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("""
+                SELECT skill, unmatched_count
+                FROM skill_counts
+                ORDER BY unmatched_count DESC, skill ASC
+                LIMIT ?
+            """, (limit,))
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def get_pdf_availability(self, application_id: int) -> Tuple[bool, bool]:
+        """
+        Check which PDFs are stored for an application without reading them.
+
+        length() is answered from the record header, so the blobs are never loaded.
+
+        Args:
+            application_id: ID of the application
+
+        Returns:
+            Tuple of (CV PDF stored, cover letter PDF stored)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT length(cv_pdf) > 0, length(cover_letter_pdf) > 0 FROM applications WHERE id = ?",
+                (application_id,)
+            ).fetchone()
+        return (bool(row[0]), bool(row[1])) if row else (False, False)
+
     def get_pdf_by_id(self, application_id: int, pdf_type: str = "cv") -> Optional[bytes]:
         """
         Retrieve PDF bytes for a specific application.
@@ -253,10 +635,16 @@ class ApplicationDatabase:
 
         Returns:
             PDF bytes or None if not found
+
+        Raises:
+            ValueError: If pdf_type is not a known PDF type
         """
-        column = "cv_pdf" if pdf_type == "cv" else "cover_letter_pdf"
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(f"SELECT {column} FROM applications WHERE id = ?", (application_id,))
+        query = SELECT_PDF_SQL.get(pdf_type)
+        if query is None:
+            raise ValueError(f"Unsupported PDF type: {pdf_type}")
+
+        with self._connect() as conn:
+            cursor = conn.execute(query, (application_id,))
             result = cursor.fetchone()
             return result[0] if result and result[0] else None
 
@@ -270,14 +658,8 @@ class ApplicationDatabase:
         Returns:
             Number of records updated
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(f"""
-                UPDATE applications
-                SET cv_pdf = NULL, cover_letter_pdf = NULL
-                WHERE created_at < datetime('now', '-{days} days')
-                AND (cv_pdf IS NOT NULL OR cover_letter_pdf IS NOT NULL)
-            """)
-            conn.commit()
+        with self._connect() as conn:
+            cursor = conn.execute(CLEANUP_OLD_PDFS_SQL, (f"-{int(days)} days",))
             return cursor.rowcount
 
     def get_pdf_storage_info(self) -> dict:
@@ -287,7 +669,7 @@ class ApplicationDatabase:
         Returns:
             Dictionary with storage statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Count records with PDFs
             cursor = conn.execute("""
                 SELECT
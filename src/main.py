@@ -5,17 +5,28 @@ Automatically generates tailored CVs and cover letters by analyzing job offers.
 """
 
 import argparse
+import re
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 import yaml
 from pathlib import Path
+from typing import Optional
 
 from .job_parser import parse_job_offer
-from .skills_matcher import match_skills
+from .skills_matcher import match_skills, get_unmatched_skills
 from .project_selector import select_projects
 from .template_processor import create_template_processor
-from .models import UserProfile, Application
-from .database import ApplicationDatabase
+from .models import UserProfile, JobOffer, MatchedSkills, SelectedProjects
+from .database import ApplicationDatabase, Application
+from .pdf_renderer import create_pdf_renderer
 from .cost_tracker import get_cost_tracker
+from .response_cache import ResponseCache, job_parsing_key, project_selection_key, skills_matching_key
+
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Characters removed from job titles/company names when building filenames
+FILENAME_UNSAFE_CHARS = re.compile(r'[^\w -]')
 
 
 def load_job_offer(job_offer_input: str) -> str:
@@ -71,12 +82,12 @@ def load_user_profile(profile_path: str) -> UserProfile:
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            profile_data = yaml.safe_load(f)
+            profile_data = yaml.load(f, Loader=YAML_LOADER)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Failed to parse YAML profile file: {e}")
 
     try:
-        return UserProfile(**profile_data)
+        return UserProfile.model_validate(profile_data)
     except Exception as e:
         raise ValueError(f"Invalid user profile data: {e}")
 
@@ -126,6 +137,11 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         default="templates/user_profile.yaml",
         help="Path to user profile YAML file (default: templates/user_profile.yaml)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call the OpenAI API even when a cached response exists for this job offer"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -189,11 +205,22 @@ def load_and_display_user_profile(profile_path: str, verbose: bool) -> UserProfi
     return user_profile
 
 
-def parse_and_display_job_offer(job_offer_text: str, user_profile: UserProfile, verbose: bool):
+def cached_llm_call(response_cache: Optional[ResponseCache], operation: str, key: str, model_cls, func, *args):
+    """Run an LLM call through the response cache, or directly when caching is disabled."""
+    if response_cache is None:
+        return func(*args)
+    return response_cache.cached_call(operation, key, model_cls, func, *args)
+
+
+def parse_and_display_job_offer(job_offer_text: str, user_profile: UserProfile, verbose: bool,
+                                response_cache: Optional[ResponseCache] = None):
     """Parse job offer and display parsing results."""
     print("\n🔧 Step 3: Parsing job offer...")
     gender = user_profile.personal_info.gender if hasattr(user_profile.personal_info, 'gender') else 'male'
-    job_offer = parse_job_offer(job_offer_text, gender=gender)
+    job_offer = cached_llm_call(
+        response_cache, "job_parsing", job_parsing_key(job_offer_text, gender), JobOffer,
+        lambda: parse_job_offer(job_offer_text, gender=gender)
+    )
     print(f"   Job Title: {job_offer.job_title}")
     print(f"   Company: {job_offer.company_name}")
     print(f"   Required Skills: {len(job_offer.skills_required)}")
@@ -205,10 +232,13 @@ def parse_and_display_job_offer(job_offer_text: str, user_profile: UserProfile,
     return job_offer
 
 
-def match_and_display_skills(job_offer, user_profile, verbose: bool):
+def match_and_display_skills(job_offer, user_profile, verbose: bool, response_cache: Optional[ResponseCache] = None):
     """Match skills and display matching results."""
     print("\n🎯 Step 4: Matching skills...")
-    matched_skills = match_skills(job_offer, user_profile)
+    matched_skills = cached_llm_call(
+        response_cache, "skills_matching", skills_matching_key(job_offer, user_profile), MatchedSkills,
+        match_skills, job_offer, user_profile
+    )
     print(f"   Matched Skills: {len(matched_skills.matched_skills)}")
     print(f"   Relevant Technologies: {len(matched_skills.relevant_technologies)}")
     print(f"   Relevant Achievements: {len(matched_skills.relevant_achievements)}")
@@ -223,10 +253,10 @@ def match_and_display_skills(job_offer, user_profile, verbose: bool):
     return matched_skills
 
 
-def select_and_display_projects(job_offer, projects):
-    """Select projects and display selection results."""
+def select_and_display_projects(projects_future: Future):
+    """Wait for the project selection started alongside skills matching and display its results."""
     print("\n📋 Step 5: Selecting relevant projects...")
-    selected_projects = select_projects(job_offer, projects)
+    selected_projects = projects_future.result()
     print(f"   Selected Project 1: {selected_projects.project1.title}")
     print(f"   Selected Project 2: {selected_projects.project2.title}")
     return selected_projects
@@ -254,10 +284,8 @@ def generate_and_display_documents(job_offer, user_profile, matched_skills, sele
 
 def generate_safe_filenames(job_offer):
     """Generate safe filenames from job offer information."""
-    job_title_safe = "".join(c for c in job_offer.job_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    job_title_safe = job_title_safe.replace(' ', '_')
-    company_safe = "".join(c for c in job_offer.company_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    company_safe = company_safe.replace(' ', '_')
+    job_title_safe = FILENAME_UNSAFE_CHARS.sub('', job_offer.job_title).rstrip().replace(' ', '_')
+    company_safe = FILENAME_UNSAFE_CHARS.sub('', job_offer.company_name).rstrip().replace(' ', '_')
 
     cv_filename = f"CV_{job_title_safe}_{company_safe}.html"
     cover_letter_filename = f"CoverLetter_{job_title_safe}_{company_safe}.html"
@@ -265,32 +293,26 @@ def generate_safe_filenames(job_offer):
     return cv_filename, cover_letter_filename
 
 
-def convert_html_to_pdf(html_content: str) -> bytes:
+def convert_html_to_pdfs(documents: list) -> list:
     """
-    Convert HTML content to PDF bytes using Playwright.
+    Convert HTML documents to PDFs with a single headless browser.
 
     Args:
-        html_content: HTML content to convert
+        documents: (html_content, output_path) pairs, output_path may be None
 
     Returns:
-        PDF as bytes
+        The PDFs as bytes, in the order of the documents
 
     Raises:
-        ImportError: If playwright is not installed
+        ModuleNotFoundError: If playwright is not installed (raised by the renderer on first use)
         Exception: If PDF conversion fails
     """
+    # One browser launch for every document instead of one per conversion
+    renderer = create_pdf_renderer()
     try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        raise ImportError("Playwright is required for PDF generation. Install with: pip install playwright")
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page(size={"width": 210*3.779, "height": 297*3.779})  # A4 in pixels
-        page.set_content(html_content)
-        pdf_bytes = page.pdf(format="A4", margin={"top": "10mm", "right": "10mm", "bottom": "10mm", "left": "10mm"})
-        browser.close()
-        return pdf_bytes
+        return renderer.html_to_pdfs(documents)
+    finally:
+        renderer.close()
 
 
 def save_and_display_files(generated_content, job_offer, matched_skills, selected_projects, output_dir, verbose: bool, job_offer_text: str = ""):
@@ -308,16 +330,13 @@ def save_and_display_files(generated_content, job_offer, matched_skills, selecte
     cv_pdf = None
     cl_pdf = None
     try:
-        cv_pdf = convert_html_to_pdf(generated_content.cv_html)
-        cl_pdf = convert_html_to_pdf(generated_content.cover_letter_html)
-
-        # Save PDFs to files
+        # Render both PDFs straight into their files
         pdf_cv_path = output_dir / cv_filename.replace('.html', '.pdf')
         pdf_cl_path = output_dir / cover_letter_filename.replace('.html', '.pdf')
-        with open(pdf_cv_path, 'wb') as f:
-            f.write(cv_pdf)
-        with open(pdf_cl_path, 'wb') as f:
-            f.write(cl_pdf)
+        cv_pdf, cl_pdf = convert_html_to_pdfs([
+            (generated_content.cv_html, str(pdf_cv_path)),
+            (generated_content.cover_letter_html, str(pdf_cl_path)),
+        ])
         print(f"📄 PDF files saved")
     except ImportError:
         print("⚠️  Playwright not available - skipping PDF generation (HTML files saved)")
@@ -330,7 +349,7 @@ def save_and_display_files(generated_content, job_offer, matched_skills, selecte
         total_skills = len(job_offer.skills_required)
         matched_count = len(matched_skills.matched_skills)
         matching_rate = (matched_count / total_skills) if total_skills > 0 else 0.0
-        unmatched_skills = list(set(job_offer.skills_required) - set(matched_skills.matched_skills))
+        unmatched_skills = get_unmatched_skills(job_offer, matched_skills)
 
         application = Application(
             company=job_offer.company_name,
@@ -380,9 +399,18 @@ def main():
     try:
         job_offer_text = load_and_display_job_offer(args.job_offer, verbose)
         user_profile = load_and_display_user_profile(args.profile, verbose)
-        job_offer = parse_and_display_job_offer(job_offer_text, user_profile, verbose)
-        matched_skills = match_and_display_skills(job_offer, user_profile, verbose)
-        selected_projects = select_and_display_projects(job_offer, user_profile.projects)
+        # Responses are shared with the Streamlit app, so repeat runs for an offer cost no API calls
+        response_cache = None if args.no_cache else ResponseCache()
+        job_offer = parse_and_display_job_offer(job_offer_text, user_profile, verbose, response_cache)
+        # Project selection only depends on the parsed offer, so it runs while skills are matched
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-selection") as selection_pool:
+            projects_future = selection_pool.submit(
+                cached_llm_call, response_cache, "project_selection",
+                project_selection_key(job_offer, user_profile.projects), SelectedProjects,
+                select_projects, job_offer, user_profile.projects
+            )
+            matched_skills = match_and_display_skills(job_offer, user_profile, verbose, response_cache)
+            selected_projects = select_and_display_projects(projects_future)
         generated_content = generate_and_display_documents(job_offer, user_profile, matched_skills, selected_projects, verbose)
         save_and_display_files(generated_content, job_offer, matched_skills, selected_projects, output_dir, verbose, job_offer_text)
 
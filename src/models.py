@@ -3,8 +3,9 @@ Pydantic data models for the AI-Powered Job Application System.
 """
 
 from datetime import date
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import FrozenSet, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobOffer(BaseModel):
@@ -19,6 +20,8 @@ class JobOffer(BaseModel):
 
 class PersonalInfo(BaseModel):
     """Personal information from user profile."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     email: str
     gender: str = Field(default="male", description="Gender for pronoun and title adaptation (male/female)")
@@ -26,28 +29,34 @@ class PersonalInfo(BaseModel):
 
 class Experience(BaseModel):
     """Work experience entry."""
+    model_config = ConfigDict(frozen=True)
+
     company: str
     role: str
     start_date: str
     end_date: str
     location: str
-    technologies: List[str]
-    achievements: List[str]
+    technologies: Tuple[str, ...]
+    achievements: Tuple[str, ...]
 
 
 class Education(BaseModel):
     """Education entry."""
+    model_config = ConfigDict(frozen=True)
+
     institution: str
     duration: str
     degree: str
-    details: List[str]
+    details: Tuple[str, ...]
 
 
 class Project(BaseModel):
     """Side project or freelance project entry."""
+    model_config = ConfigDict(frozen=True)
+
     title: str
     description: str
-    technologies: List[str]
+    technologies: Tuple[str, ...]
     url: str = ""
     start_date: str = ""
     end_date: str = ""
@@ -57,25 +66,35 @@ class Project(BaseModel):
 
 class UserProfile(BaseModel):
     """Complete user profile model matching YAML structure."""
+    # Immutable, tuples included: one validated profile is shared across reruns and sessions
+    model_config = ConfigDict(frozen=True)
+
     personal_info: PersonalInfo
-    experiences: List[Experience]
-    skills: List[str]
-    education: List[Education]
-    projects: List[Project]
-    languages: List[str]
-    achievements: List[str]
-    hobbies: List[str]
+    experiences: Tuple[Experience, ...]
+    skills: Tuple[str, ...]
+    education: Tuple[Education, ...]
+    projects: Tuple[Project, ...]
+    languages: Tuple[str, ...]
+    achievements: Tuple[str, ...]
+    hobbies: Tuple[str, ...]
     urls: dict = Field(default_factory=dict)
 
 
 class MatchedSkills(BaseModel):
     """Skills matching results."""
+    model_config = ConfigDict(frozen=True)
+
     user_skills: List[str] = Field(..., description="User's available skills")
     job_skills: List[str] = Field(..., description="Job required skills")
     matched_skills: List[str] = Field(..., description="Skills that match between user and job")
     relevant_technologies: List[str] = Field(..., description="Most relevant technologies to highlight")
     key_value_contributions: List[str] = Field(..., description="3-5 dynamic paragraphs demonstrating how user adds value to the organization")
 
+    @cached_property
+    def matched_skill_keys(self) -> FrozenSet[str]:
+        """Lower-cased matched skills, built once for case-insensitive membership tests."""
+        return frozenset(skill.lower() for skill in self.matched_skills)
+
 
 class SelectedProjects(BaseModel):
     """Selected projects for CV/cover letter."""
@@ -0,0 +1,367 @@
+"""
+HTML to PDF rendering with a long-lived headless Chromium.
+Launching a browser dominates the cost of a conversion, so one browser and one
+browser context are kept alive for the whole process and each conversion only
+opens a page.
+Rendered PDFs are also cached by content hash, in memory and on disk, so the same
+HTML is never sent to Chromium twice, even across restarts. WeasyPrint can be selected instead of Chromium with PDF_ENGINE=weasyprint.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import weasyprint
+except ImportError:
+    weasyprint = None
+
+logger = logging.getLogger(__name__)
+
+# Chromium flags suited to a headless, containerised renderer; with the GPU disabled,
+# the SwiftShader software GPU is not needed for printing either (Playwright already
+# passes --disable-extensions and its other automation defaults)
+DEFAULT_LAUNCH_ARGS = ("--disable-gpu", "--disable-dev-shm-usage", "--disable-software-rasterizer")
+
+PDF_OPTIONS = {
+    "format": "A4",
+    "margin": {"top": "1cm", "right": "1cm", "bottom": "1cm", "left": "1cm"},
+    "print_background": True,
+}
+
+# Documents whose markup never mentions a background skip background painting,
+# which saves Chromium a compositing pass and keeps the PDF smaller
+PDF_OPTIONS_WITHOUT_BACKGROUNDS = {**PDF_OPTIONS, "print_background": False}
+BACKGROUND_PATTERN = re.compile(r"background|bgcolor", re.IGNORECASE)
+
+# The templates are static HTML, so pages are rendered without running any JavaScript.
+# Images stay enabled (and set_content keeps waiting for "load"): the CV pulls its
+# photo and contact icons from remote URLs.
+CONTEXT_OPTIONS = {"java_script_enabled": False}
+
+# Page setup applied by WeasyPrint, matching PDF_OPTIONS
+WEASYPRINT_PAGE_CSS = "@page { size: A4; margin: 1cm; }"
+
+# Number of rendered PDFs kept in memory, most recently used first
+PDF_CACHE_SIZE = 64
+
+# On-disk tier of the PDF cache, trimmed to PDF_DISK_CACHE_BYTES, least recently used first
+DEFAULT_PDF_CACHE_DIR = Path.home() / ".cache" / "simpleapply" / "pdf"
+PDF_DISK_CACHE_BYTES = 200 * 1024 * 1024
+
+# Bump when PDF_OPTIONS or the page setup change so stale PDFs are no longer served
+PDF_CACHE_VERSION = "2"
+
+# Documents rendered at the same time; further conversions wait for a free slot
+MAX_CONCURRENT_PAGES = 5
+
+
+def _pdf_options(html_content: str) -> dict:
+    """Return the page.pdf options, printing backgrounds only if the document sets any."""
+    if BACKGROUND_PATTERN.search(html_content):
+        return PDF_OPTIONS
+    return PDF_OPTIONS_WITHOUT_BACKGROUNDS
+
+
+class PdfRenderer:
+    """
+    Renders HTML to PDF bytes with a persistent Chromium instance.
+
+    Playwright objects are bound to the thread that created them, while Streamlit
+    runs every script rerun on its own thread. The browser is therefore driven by
+    an asyncio event loop on a single dedicated thread; conversions are scheduled
+    onto that loop, so several documents can render concurrently as pages of one
+    shared browser context.
+    """
+
+    # Engine name, part of the cache key so engines never serve each other's PDFs
+    engine = "chromium"
+
+    def __init__(self, launch_args: tuple = DEFAULT_LAUNCH_ARGS, cache_size: int = PDF_CACHE_SIZE,
+                 cdp_url: Optional[str] = None, max_pages: int = MAX_CONCURRENT_PAGES,
+                 cache_dir: Optional[Path] = None, disk_cache_bytes: int = PDF_DISK_CACHE_BYTES,
+                 sandbox: bool = True):
+        self._launch_args = list(launch_args)
+        # The renderer loads templates, LLM output and remote images, so Chromium keeps its
+        # sandbox; Playwright adds --no-sandbox itself unless chromium_sandbox is set
+        self._sandbox = sandbox
+        # Attach to an already running Chromium instead of launching one
+        self._cdp_url = cdp_url
+        # Only touched from the event loop thread, so no lock is needed
+        self._cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._cache_size = cache_size
+        # None disables the on-disk tier
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._disk_cache_bytes = disk_cache_bytes
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._browser_lock = asyncio.Lock()
+        # Bounds the open pages when several sessions convert at once
+        self._page_slots = asyncio.Semaphore(max_pages)
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="pdf-renderer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _submit(self, coro) -> Future:
+        """Schedule a coroutine on the renderer's event loop."""
+        if self._closed:
+            coro.close()
+            raise RuntimeError("PDF renderer is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _get_browser(self):
+        """Return the shared browser, (re)launching or reconnecting it if needed."""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    # Imported here so that loading Playwright happens on the renderer thread
+                    # (during warm_up) instead of delaying the app's first page, and never
+                    # happens at all with the WeasyPrint engine
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                if self._cdp_url:
+                    logger.info(f"Connecting to shared Chromium at {self._cdp_url} for PDF rendering")
+                    self._browser = await self._playwright.chromium.connect_over_cdp(self._cdp_url)
+                else:
+                    logger.info("Launching persistent Chromium for PDF rendering")
+                    self._browser = await self._playwright.chromium.launch(args=self._launch_args, chromium_sandbox=self._sandbox)
+                # The context belonged to the previous browser
+                self._context = None
+            return self._browser
+
+    async def _get_context(self):
+        """
+        Return the browser context shared by every render, created once per browser.
+
+        Sharing it skips the per-document context setup and keeps its HTTP cache,
+        so the remote photo and icons of the CV are only downloaded once.
+        """
+        browser = await self._get_browser()
+        async with self._browser_lock:
+            if self._context is None:
+                self._context = await browser.new_context(**CONTEXT_OPTIONS)
+            return self._context
+
+    def warm_up(self) -> Future:
+        """
+        Launch the browser and open the shared context in the background without waiting for them.
+
+        Conversions requested meanwhile wait for the same launch instead of starting
+        another one. A failed launch is only logged; the next conversion retries it.
+        """
+        future = self._submit(self._get_context())
+        future.add_done_callback(self._log_warm_up_failure)
+        return future
+
+    @staticmethod
+    def _log_warm_up_failure(future: Future) -> None:
+        """Report a failed background browser launch."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Could not pre-launch Chromium: {str(future.exception())}")
+
+    async def _render_page(self, html_content: str) -> bytes:
+        """Render one document in its own page."""
+        context = await self._get_context()
+        page = await context.new_page()
+        try:
+            await page.set_content(html_content)
+            return await page.pdf(**_pdf_options(html_content))
+        finally:
+            await page.close()
+
+    def _read_disk_cache(self, key: bytes) -> Optional[bytes]:
+        """Return a PDF from the on-disk cache, or None on a miss."""
+        if self._cache_dir is None:
+            return None
+        path = self._cache_dir / f"{key.hex()}.pdf"
+        try:
+            pdf_bytes = path.read_bytes()
+            # Mark the entry as recently used for trimming
+            os.utime(path)
+        except OSError:
+            return None
+        logger.info("Served PDF from the on-disk render cache")
+        return pdf_bytes
+
+    def _write_disk_cache(self, key: bytes, pdf_bytes: bytes) -> None:
+        """Store a PDF in the on-disk cache, then trim the cache to its size budget."""
+        if self._cache_dir is None:
+            return
+        path = self._cache_dir / f"{key.hex()}.pdf"
+        # Written under a temporary name so other processes (and executor threads)
+        # never read a partial file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(pdf_bytes)
+            temp_path.replace(path)
+
+            entries = []
+            for entry in self._cache_dir.glob("*.pdf"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry))
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda item: item[0]):
+                if total <= self._disk_cache_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+        except OSError as e:
+            logger.warning(f"Could not update the on-disk PDF cache: {str(e)}")
+
+    async def _render(self, html_content: str, output_path: Optional[str]) -> bytes:
+        """Return the PDF for a document, from the cache when the same HTML was already rendered."""
+        key = hashlib.blake2b(
+            html_content.encode("utf-8"), digest_size=16,
+            person=f"{self.engine}-{PDF_CACHE_VERSION}".encode("utf-8")
+        ).digest()
+        # Disk I/O runs in the default executor so it never stalls the other conversions
+        loop = asyncio.get_running_loop()
+        pdf_bytes = self._cache.get(key)
+        if pdf_bytes is None:
+            pdf_bytes = await loop.run_in_executor(None, self._read_disk_cache, key)
+            if pdf_bytes is None:
+                async with self._page_slots:
+                    pdf_bytes = await self._render_page(html_content)
+                await loop.run_in_executor(None, self._write_disk_cache, key, pdf_bytes)
+            self._cache[key] = pdf_bytes
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+            logger.info("Served PDF from the render cache")
+
+        if output_path is not None:
+            await loop.run_in_executor(None, Path(output_path).write_bytes, pdf_bytes)
+        return pdf_bytes
+
+    def html_to_pdf(self, html_content: str, output_path: Optional[str] = None) -> bytes:
+        """
+        Convert HTML content to PDF bytes, optionally writing them to output_path.
+
+        Args:
+            html_content: Complete HTML document to render
+            output_path: File to write the PDF to (None to only return the bytes)
+
+        Returns:
+            The rendered PDF as bytes
+        """
+        return self._submit(self._render(html_content, output_path)).result()
+
+    def html_to_pdfs(self, documents: List[Tuple[str, Optional[str]]]) -> List[bytes]:
+        """
+        Convert several HTML documents concurrently, each in its own page.
+
+        Args:
+            documents: (html_content, output_path) pairs, output_path may be None
+
+        Returns:
+            The rendered PDFs as bytes, in the order of the documents
+        """
+        async def render_all():
+            return await asyncio.gather(*(self._render(html, path) for html, path in documents))
+
+        return list(self._submit(render_all()).result())
+
+    async def _shutdown(self) -> None:
+        """Close the browser and stop Playwright, once any launch in progress has finished."""
+        async with self._browser_lock:
+            if self._context is not None:
+                await self._context.close()
+                self._context = None
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def close(self) -> None:
+        """Close the browser and stop the event loop thread. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=30)
+        except Exception as e:
+            logger.warning(f"Error while closing PDF renderer: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=30)
+
+
+class WeasyPrintRenderer(PdfRenderer):
+    """
+    Renders HTML to PDF with WeasyPrint instead of a browser.
+
+    No Chromium process is started: documents are laid out by WeasyPrint on worker
+    threads of the renderer's event loop, and share its PDF cache. WeasyPrint does
+    not run JavaScript and only partly supports flexbox, so check the output of
+    your templates before switching engines.
+    """
+
+    engine = "weasyprint"
+
+    def __init__(self, cache_size: int = PDF_CACHE_SIZE, max_pages: int = MAX_CONCURRENT_PAGES,
+                 cache_dir: Optional[Path] = None, disk_cache_bytes: int = PDF_DISK_CACHE_BYTES):
+        if weasyprint is None:
+            raise ImportError("WeasyPrint is required for PDF_ENGINE=weasyprint. Install with: pip install weasyprint")
+        super().__init__(cache_size=cache_size, max_pages=max_pages,
+                         cache_dir=cache_dir, disk_cache_bytes=disk_cache_bytes)
+        self._page_css = weasyprint.CSS(string=WEASYPRINT_PAGE_CSS)
+
+    async def _get_browser(self):
+        """No browser is needed"""
+        return None
+
+    async def _get_context(self):
+        """No browser context is needed either, so warming up does nothing"""
+        return None
+
+    async def _render_page(self, html_content: str) -> bytes:
+        """Lay out one document on a worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._write_pdf, html_content)
+
+    def _write_pdf(self, html_content: str) -> bytes:
+        """Render a document with WeasyPrint."""
+        return weasyprint.HTML(string=html_content).write_pdf(stylesheets=[self._page_css])
+
+
+def create_pdf_renderer() -> PdfRenderer:
+    """
+    Create the renderer selected by the PDF_ENGINE environment variable.
+
+    With the Chromium engine, PDF_BROWSER_CDP_URL (e.g. http://localhost:9222) makes
+    the renderer attach to a browser started once with --remote-debugging-port, so
+    several processes share a single Chromium instead of launching their own.
+
+    PDF_BROWSER_NO_SANDBOX=1 launches Chromium without its sandbox, which it needs when
+    running as root (as in many containers); the sandbox stays on otherwise.
+
+    Rendered PDFs are kept on disk in PDF_CACHE_DIR (default ~/.cache/simpleapply/pdf);
+    set it to an empty value to disable the on-disk cache.
+
+    Returns:
+        A Chromium PdfRenderer ("chromium", the default) or a WeasyPrintRenderer ("weasyprint")
+
+    Raises:
+        ValueError: If PDF_ENGINE names an unknown engine
+    """
+    engine = os.getenv("PDF_ENGINE", "chromium").strip().lower()
+    cache_dir = os.getenv("PDF_CACHE_DIR", str(DEFAULT_PDF_CACHE_DIR)).strip() or None
+    if engine == "weasyprint":
+        return WeasyPrintRenderer(cache_dir=cache_dir)
+    if engine != "chromium":
+        raise ValueError(f"Unknown PDF_ENGINE '{engine}', expected 'chromium' or 'weasyprint'")
+    no_sandbox = os.getenv("PDF_BROWSER_NO_SANDBOX", "").strip().lower() in ("1", "true", "yes")
+    return PdfRenderer(cdp_url=os.getenv("PDF_BROWSER_CDP_URL"), cache_dir=cache_dir, sandbox=not no_sandbox)
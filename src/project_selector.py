@@ -305,8 +305,9 @@ if __name__ == "__main__":
         job_offer = parse_job_offer(sample_job)
 
         # Load user profile
-        with open("templates/user_profile.yaml", "r") as f:
-            profile_data = yaml.safe_load(f)
+        # libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+        with open("templates/user_profile.yaml", "rb") as f:
+            profile_data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
         # Extract projects
         projects = [Project(**project_data) for project_data in profile_data["projects"]]
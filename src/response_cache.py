@@ -0,0 +1,117 @@
+"""
+Persistent cache of LLM responses.
+Responses are stored in a small SQLite database keyed by a SHA-256 hash of the
+call inputs, so processing the same job offer again costs no API calls.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Callable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .cost_tracker import get_cost_tracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "simpleapply" / "responses.db"
+
+# Bump when prompts or models change so stale responses are no longer served
+CACHE_VERSION = "1"
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def make_cache_key(*parts: str) -> str:
+    """Hash the given inputs (plus the cache version) into a cache key."""
+    digest = hashlib.sha256(CACHE_VERSION.encode("utf-8"))
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def job_parsing_key(job_offer_text: str, gender: str) -> str:
+    """Cache key of a job offer parsing call."""
+    return make_cache_key(job_offer_text, gender)
+
+
+def skills_matching_key(job_offer: BaseModel, user_profile: BaseModel) -> str:
+    """Cache key of a skills matching call, covering the parsed offer and the whole profile."""
+    return make_cache_key(job_offer.model_dump_json(), user_profile.model_dump_json())
+
+
+def project_selection_key(job_offer: BaseModel, projects: List[BaseModel]) -> str:
+    """Cache key of a project selection call, covering the parsed offer and the candidate projects."""
+    return make_cache_key(job_offer.model_dump_json(), *(project.model_dump_json() for project in projects))
+
+
+class ResponseCache:
+    """SQLite-backed store of model responses, serialized as JSON."""
+
+    def __init__(self, db_path: Path = DEFAULT_CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    operation TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (operation, key)
+                )
+            """)
+
+    def get(self, operation: str, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT value FROM responses WHERE operation = ? AND key = ?", (operation, key)
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def set(self, operation: str, key: str, value: str) -> None:
+        """Store (or replace) the cached response for a key"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (operation, key, value) VALUES (?, ?, ?)",
+                    (operation, key, value)
+                )
+        finally:
+            conn.close()
+
+    def cached_call(self, operation: str, key: str, model_cls: Type[T], func: Callable[..., T], *args) -> T:
+        """
+        Return the cached model for a key, calling func(*args) and caching its result on a miss.
+
+        Args:
+            operation: Operation name, also used to label cache hits in the cost tracker
+            key: Cache key, usually built with make_cache_key()
+            model_cls: Pydantic model the response is validated into
+            func: Function performing the LLM call
+            *args: Arguments passed to func on a miss
+
+        Returns:
+            The cached or freshly computed model
+        """
+        cached = self.get(operation, key)
+        if cached is not None:
+            try:
+                result = model_cls.model_validate_json(cached)
+                get_cost_tracker().add_cache_hit(operation)
+                logger.info(f"Served {operation} from the response cache")
+                return result
+            except ValidationError:
+                logger.warning(f"Discarding incompatible cached {operation} response")
+
+        result = func(*args)
+        self.set(operation, key, result.model_dump_json())
+        return result
@@ -95,7 +95,7 @@ JOB OFFER:
 - Required Skills: {job_offer.skills_required}
 
 USER PROFILE:
-- Skills: {user_profile.skills}
+- Skills: {list(user_profile.skills)}
 - Technologies from Experience: {user_technologies}
 - Achievements: {user_achievements}
 
@@ -262,6 +262,26 @@ def match_skills(job_offer: JobOffer, user_profile: UserProfile) -> MatchedSkill
         raise SkillsMatcherError(f"Unexpected error during skills matching: {e}")
 
 
+def get_unmatched_skills(job_offer: JobOffer, matched_skills: MatchedSkills) -> List[str]:
+    """
+    Get the required job skills that were not matched, ignoring case.
+
+    Args:
+        job_offer: Parsed job offer information
+        matched_skills: Skills matching results
+
+    Returns:
+        Unmatched skills in the order they appear in the job offer, without duplicates
+    """
+    matched = matched_skills.matched_skill_keys
+    unmatched = {}
+    for skill in job_offer.skills_required:
+        key = skill.lower()
+        if key not in matched:
+            unmatched.setdefault(key, skill)
+    return list(unmatched.values())
+
+
 def match_skills_safe(job_offer: JobOffer, user_profile: UserProfile) -> MatchedSkills | None:
     """
     Safe version of match_skills that returns None on error instead of raising.
@@ -310,8 +330,9 @@ if __name__ == "__main__":
         job_offer = parse_job_offer(sample_job)
 
         # Load user profile
-        with open("templates/user_profile.yaml", "r") as f:
-            profile_data = yaml.safe_load(f)
+        # libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+        with open("templates/user_profile.yaml", "rb") as f:
+            profile_data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
         user_profile = UserProfile(**profile_data)
 
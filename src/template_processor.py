@@ -8,6 +8,7 @@ Includes multilingual support for generating documents in the language of the jo
 
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
 from datetime import date
 from typing import Dict, Any, List, Optional
@@ -21,6 +22,27 @@ from .job_title_parser import extract_gender_form
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _placeholder_pattern(placeholders: tuple) -> "re.Pattern[str]":
+    """
+    Compile one pattern matching any of the placeholders in all three forms:
+    <!-- PLACEHOLDER -->, {PLACEHOLDER} and [PLACEHOLDER], case-insensitively.
+    Cached, since every document of a kind is generated with the same keys.
+    """
+    names = "|".join(re.escape(placeholder) for placeholder in placeholders)
+    return re.compile(
+        f"<!--\\s*({names})\\s*-->|\\{{\\s*({names})\\s*\\}}|\\[\\s*({names})\\s*\\]",
+        flags=re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=16)
+def _read_template(path: str, mtime_ns: int) -> str:
+    """Read a template file, cached until its modification time changes (e.g. in the Template Editor)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 class TemplateProcessor:
     """Processes HTML templates with dynamic content insertion."""
 
@@ -103,8 +125,7 @@ class TemplateProcessor:
             raise FileNotFoundError(f"Template not found: {template_path}")
 
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_template(str(template_path), template_path.stat().st_mtime_ns)
         except IOError as e:
             raise IOError(f"Failed to read template {template_path}: {e}")
 
@@ -119,22 +140,14 @@ class TemplateProcessor:
         Returns:
             Template with placeholders replaced
         """
-        result = template
-
-        for placeholder, value in replacements.items():
-            # Replace HTML comments (<!-- PLACEHOLDER -->)
-            comment_pattern = f"<!--\\s*{re.escape(placeholder)}\\s*-->"
-            result = re.sub(comment_pattern, value, result, flags=re.IGNORECASE)
-
-            # Replace direct placeholders {PLACEHOLDER}
-            direct_pattern = f"\\{{\\s*{re.escape(placeholder)}\\s*\\}}"
-            result = re.sub(direct_pattern, value, result, flags=re.IGNORECASE)
-
-            # Replace bracket placeholders [PLACEHOLDER]
-            bracket_pattern = f"\\[\\s*{re.escape(placeholder)}\\s*\\]"
-            result = re.sub(bracket_pattern, value, result, flags=re.IGNORECASE)
-
-        return result
+        if not replacements:
+            return template
+
+        # Every placeholder is replaced in a single pass over the template. Values are
+        # inserted literally, so backslashes in user or LLM text are kept as-is.
+        values = {placeholder.lower(): value for placeholder, value in replacements.items()}
+        pattern = _placeholder_pattern(tuple(replacements))
+        return pattern.sub(lambda match: values[match.group(match.lastindex).lower()], template)
 
     def _translate_static_content(self, html: str, language: str, section: str) -> str:
         """
@@ -13,18 +13,37 @@ import streamlit as st
 import yaml
 import logging
 import base64
+import contextvars
+import functools
+import math
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from playwright.sync_api import sync_playwright
 from pathlib import Path
+from typing import Optional
 
 from src.job_parser import parse_job_offer
-from src.skills_matcher import match_skills
+from src.skills_matcher import match_skills, get_unmatched_skills
 from src.project_selector import select_projects
-from src.template_processor import create_template_processor
-from src.models import UserProfile
-from src.cost_tracker import get_cost_tracker, reset_cost_tracker
+from src.template_processor import TemplateProcessor, create_template_processor
+from src.models import UserProfile, JobOffer, MatchedSkills, SelectedProjects
+from src.cost_tracker import CostTracker, generation_cost_tracker, get_cost_tracker, reset_cost_tracker
 from src.database import ApplicationDatabase, Application
+from src.pdf_renderer import PdfRenderer, create_pdf_renderer
+from src.response_cache import ResponseCache, job_parsing_key, project_selection_key, skills_matching_key
+from src.main import cached_llm_call
+
+# Analytics dependencies are optional; the dashboard degrades gracefully without them
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import plotly.express as px
+except ImportError:
+    px = None
 
 # Configure logging
 logging.basicConfig(
@@ -36,48 +55,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of applications shown per page in the Historics table
+HISTORICS_PAGE_SIZES = (25, 50, 100)
+
+# Custom color theme injected on every page
+THEME_CSS_PATH = "assets/theme.css"
+
+# Historics sort options, keyed by ApplicationDatabase ordering name
+HISTORICS_SORT_OPTIONS = {
+    "newest": "Newest first",
+    "oldest": "Oldest first",
+    "match_desc": "Highest match rate",
+    "match_asc": "Lowest match rate",
+    "cost_desc": "Highest cost",
+    "company": "Company (A-Z)",
+}
+
+# Session state written by a completed generation (documents, parsed offer and filenames)
+GENERATION_RESULT_KEYS = (
+    "cv_html", "cover_letter_html", "job_offer", "matched_skills",
+    "application", "generation_costs", "cv_pdf_name", "cl_pdf_name",
+)
+
+# Analytics figures kept per chart (one per data version/day is all that is ever reused)
+FIGURE_CACHE_ENTRIES = 4
+
+# Characters removed from company/position names when building filenames
+FILENAME_UNSAFE_CHARS = re.compile(r'[^\w -]')
+
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load, much faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Base directory of saved documents, resolved once instead of on every save
+APPLICATIONS_DIR = Path.home() / "Downloads" / "Applications"
+
+
+@st.cache_resource
+def get_db() -> ApplicationDatabase:
+    """Return the shared application database handle (schema set up once per process)."""
+    return ApplicationDatabase()
+
+
+@st.cache_resource
+def get_template_processor() -> TemplateProcessor:
+    """Return the shared template processor, with translations loaded once per process."""
+    return create_template_processor()
+
+
+@st.cache_resource
+def get_response_cache() -> ResponseCache:
+    """Return the shared on-disk cache of LLM responses."""
+    return ResponseCache()
+
+
+@st.cache_resource
+def get_pdf_renderer() -> PdfRenderer:
+    """Return the process-wide PDF renderer, which keeps one Chromium instance alive across reruns."""
+    renderer = create_pdf_renderer()
+    # Launch Chromium while the user is still filling in the form
+    renderer.warm_up()
+    return renderer
+
 
-def convert_html_to_pdf(html_content: str) -> bytes:
-    """Convert HTML content to PDF bytes using Playwright."""
+def convert_html_to_pdf(html_content: str, output_path: str | None = None) -> bytes:
+    """Convert HTML content to PDF bytes using Playwright, optionally writing them to output_path."""
     logger.info("Starting HTML to PDF conversion")
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.set_content(html_content)
-        pdf_bytes = page.pdf(
-            format='A4',
-            margin={'top': '1cm', 'right': '1cm', 'bottom': '1cm', 'left': '1cm'},
-            print_background=True
-        )
-        browser.close()
-        logger.info("PDF conversion completed successfully")
-        return pdf_bytes
+    pdf_bytes = get_pdf_renderer().html_to_pdf(html_content, output_path)
+    logger.info("PDF conversion completed successfully")
+    return pdf_bytes
+
 
+def render_application_pdfs(cv_html: str, cover_letter_html: str) -> tuple[bytes, bytes]:
+    """Render the CV and cover letter PDFs concurrently; the renderer caches both for later requests."""
+    cv_pdf, cl_pdf = get_pdf_renderer().html_to_pdfs([(cv_html, None), (cover_letter_html, None)])
+    return cv_pdf, cl_pdf
 
-def save_file_to_applications(content: bytes, filename: str, file_type: str) -> str:
-    """Save file to ~/Downloads/Applications/ directory organized by type and return the full path."""
-    # Create the base directory path
-    base_path = Path.home() / "Downloads" / "Applications"
 
+def get_application_file_path(filename: str, file_type: str) -> str:
+    """Return the path of a file in ~/Downloads/Applications/, organized by type, creating its directory."""
     # Determine subdirectory based on file type
     if "CV" in file_type:
-        downloads_path = base_path / "CVs"
+        downloads_path = APPLICATIONS_DIR / "CVs"
     elif "Cover Letter" in file_type:
-        downloads_path = base_path / "CoverLetters"
+        downloads_path = APPLICATIONS_DIR / "CoverLetters"
     else:
-        downloads_path = base_path
+        downloads_path = APPLICATIONS_DIR
 
+    # Still checked on every save, so a folder deleted while the app runs is recreated
     downloads_path.mkdir(parents=True, exist_ok=True)
 
-    # Create full file path
-    file_path = downloads_path / filename
-
-    # Write the file
-    with open(file_path, 'wb') as f:
-        f.write(content)
-
-    logger.info(f"Saved {file_type} to {file_path}")
-    return str(file_path)
+    return str(downloads_path / filename)
 
 
 def display_pdf_preview(pdf_bytes: bytes, pdf_type: str = "PDF") -> None:
@@ -115,28 +182,54 @@ def display_pdf_preview(pdf_bytes: bytes, pdf_type: str = "PDF") -> None:
         logger.error(f"PDF preview error for {pdf_type}: {str(e)}")
 
 
-def auto_download_and_play_audio(cv_html: str, cover_letter_html: str, job_offer: object, application_id: int) -> None:
-    """Automatically download CV and Cover Letter PDFs and play audio."""
-    try:
-        # Generate clean filenames
-        company_clean = "".join(c for c in job_offer.company_name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
-        position_clean = "".join(c for c in job_offer.job_title if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
+def sanitize_filename_part(text: str) -> str:
+    """Keep only alphanumerics, spaces, dashes and underscores, then turn spaces into underscores."""
+    return FILENAME_UNSAFE_CHARS.sub('', text).strip().replace(' ', '_')
 
-        cv_pdf_name = f"CV_{company_clean}_{position_clean}.pdf"
-        cl_pdf_name = f"Cover_Letter_{company_clean}_{position_clean}.pdf"
 
-        # Convert HTML to PDFs
-        logger.info("Converting CVs and cover letters to PDF")
-        cv_pdf = convert_html_to_pdf(cv_html)
-        cl_pdf = convert_html_to_pdf(cover_letter_html)
+def build_pdf_filenames(job_offer: object) -> tuple[str, str]:
+    """Build the CV and cover letter PDF filenames for a parsed job offer."""
+    company_clean = sanitize_filename_part(job_offer.company_name)
+    position_clean = sanitize_filename_part(job_offer.job_title)
+    return f"CV_{company_clean}_{position_clean}.pdf", f"Cover_Letter_{company_clean}_{position_clean}.pdf"
+
+
+@st.cache_resource(show_spinner=False)
+def load_default_profile(path: str, mtime: float) -> UserProfile:
+    """
+    Load and validate the profile YAML, cached until the file's modification time changes.
+    The profile models are frozen and hold tuples, so the one instance is shared instead of copied per rerun.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        profile_data = yaml.load(f, Loader=YAML_LOADER)
+    return UserProfile.model_validate(profile_data)
+
+
+@st.cache_data(show_spinner=False)
+def load_theme_css(path: str, mtime: float) -> str:
+    """Read the app stylesheet, cached until the file's modification time changes."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@st.cache_resource(show_spinner=False)
+def load_uploaded_profile(content: bytes) -> UserProfile:
+    """Parse and validate an uploaded profile YAML, cached by the uploaded content (shared like the default profile)."""
+    profile_data = yaml.load(content, Loader=YAML_LOADER)
+    return UserProfile.model_validate(profile_data)
 
-        # Save files
-        logger.info("Saving PDF files to Applications directory")
-        cv_path = save_file_to_applications(cv_pdf, cv_pdf_name, "CV PDF")
-        cl_path = save_file_to_applications(cl_pdf, cl_pdf_name, "Cover Letter PDF")
+
+def auto_download_and_play_audio(cv_html: str, cover_letter_html: str, cv_pdf_name: str, cl_pdf_name: str, application_id: int) -> None:
+    """Automatically download CV and Cover Letter PDFs and play audio."""
+    try:
+        # Convert HTML to PDFs, written straight into the Applications directory
+        logger.info("Converting CVs and cover letters to PDF")
+        cv_path = get_application_file_path(cv_pdf_name, "CV PDF")
+        cl_path = get_application_file_path(cl_pdf_name, "Cover Letter PDF")
+        cv_pdf, cl_pdf = get_pdf_renderer().html_to_pdfs([(cv_html, cv_path), (cover_letter_html, cl_path)])
+        logger.info(f"Saved CV PDF to {cv_path} and Cover Letter PDF to {cl_path}")
 
         # Store in database
-        db = ApplicationDatabase()
+        db = get_db()
         updated_app = db.get_application(application_id)
         if updated_app:
             updated_app.cv_pdf = cv_pdf
@@ -168,49 +261,66 @@ def auto_download_and_play_audio(cv_html: str, cover_letter_html: str, job_offer
         st.error(f"Error during auto-download: {str(e)}")
 
 
-def process_job_application(job_offer_text: str, user_profile: UserProfile) -> tuple[str, str, object, object, int]:
-    """Process job application and return CV, cover letter HTML, job offer data, matched skills, and application ID."""
+def process_job_application(job_offer_text: str, user_profile: UserProfile, db: ApplicationDatabase,
+                            template_processor: TemplateProcessor,
+                            response_cache: Optional[ResponseCache]) -> tuple[str, str, JobOffer, MatchedSkills, Application, CostTracker]:
+    """
+    Process job application and return CV, cover letter HTML, job offer data, matched skills, the saved application
+    and the costs of this generation.
+
+    A response_cache of None calls the OpenAI API even when a cached response exists.
+    """
     logger.info("Starting job application processing")
 
-    # Initialize database
-    db = ApplicationDatabase()
-
-    # Parse job offer
-    logger.info("Parsing job offer text")
-    gender = user_profile.personal_info.gender if hasattr(user_profile.personal_info, 'gender') else 'male'
-    job_offer = parse_job_offer(job_offer_text, gender=gender)
-    logger.info(f"Parsed job offer for {job_offer.company_name} - {job_offer.job_title}")
-
-    # Match skills
-    logger.info("Matching user skills with job requirements")
-    matched_skills = match_skills(job_offer, user_profile)
-    logger.info(f"Found {len(matched_skills.matched_skills)} matching skills")
-
-    # Select projects
-    logger.info("Selecting most relevant projects")
-    selected_projects = select_projects(job_offer, user_profile.projects)
-    logger.info(f"Selected {selected_projects} projects")
-
-    # Generate documents
-    logger.info("Generating CV and cover letter templates")
-    template_processor = create_template_processor()
-    generated_content = template_processor.process_templates(
-        job_offer=job_offer,
-        user_profile=user_profile,
-        matched_skills=matched_skills,
-        selected_projects=selected_projects
-    )
+    # Costs are tracked per generation so concurrent sessions do not mix them
+    with generation_cost_tracker() as cost_tracker:
+        # Parse job offer
+        logger.info("Parsing job offer text")
+        gender = user_profile.personal_info.gender if hasattr(user_profile.personal_info, 'gender') else 'male'
+        job_offer = cached_llm_call(
+            response_cache, "job_parsing", job_parsing_key(job_offer_text, gender), JobOffer,
+            lambda: parse_job_offer(job_offer_text, gender=gender)
+        )
+        logger.info(f"Parsed job offer for {job_offer.company_name} - {job_offer.job_title}")
+
+        # LLM responses downstream of parsing are cached by the parsed offer and the relevant profile data
+        skills_key = skills_matching_key(job_offer, user_profile)
+        projects_key = project_selection_key(job_offer, user_profile.projects)
+
+        # Match skills and select projects concurrently - both only depend on the parsed job offer
+        logger.info("Matching user skills with job requirements and selecting most relevant projects")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-selection") as selection_pool:
+            # Run in a copy of this context so the selection is recorded in this generation's tracker
+            projects_future = selection_pool.submit(
+                contextvars.copy_context().run, cached_llm_call,
+                response_cache, "project_selection", projects_key, SelectedProjects,
+                select_projects, job_offer, user_profile.projects
+            )
+            matched_skills = cached_llm_call(
+                response_cache, "skills_matching", skills_key, MatchedSkills, match_skills, job_offer, user_profile
+            )
+            logger.info(f"Found {len(matched_skills.matched_skills)} matching skills")
+            selected_projects = projects_future.result()
+        logger.info(f"Selected {selected_projects} projects")
+
+        # Generate documents
+        logger.info("Generating CV and cover letter templates")
+        generated_content = template_processor.process_templates(
+            job_offer=job_offer,
+            user_profile=user_profile,
+            matched_skills=matched_skills,
+            selected_projects=selected_projects
+        )
     logger.info("Document generation completed successfully")
 
     # Calculate application cost and matching rate
-    cost_tracker = get_cost_tracker()
     application_cost = cost_tracker.total_cost
     total_skills = len(job_offer.skills_required)
     matched_count = len(matched_skills.matched_skills)
     matching_rate = (matched_count / total_skills) if total_skills > 0 else 0.0
 
     # Get unmatched skills
-    unmatched_skills = list(set(job_offer.skills_required) - set(matched_skills.matched_skills))
+    unmatched_skills = get_unmatched_skills(job_offer, matched_skills)
 
     # Save application to database
     application = Application(
@@ -224,10 +334,116 @@ def process_job_application(job_offer_text: str, user_profile: UserProfile) -> t
         application_cost=application_cost
     )
 
-    application_id = db.save_application(application)
-    logger.info(f"Application saved to database with ID: {application_id}")
+    application.id = db.save_application(application)
+    logger.info(f"Application saved to database with ID: {application.id}")
+
+    return generated_content.cv_html, generated_content.cover_letter_html, job_offer, matched_skills, application, cost_tracker
+
 
-    return generated_content.cv_html, generated_content.cover_letter_html, job_offer, matched_skills, application_id
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_applications_page(apps_version: tuple, limit: int, offset: int, company: str | None,
+                           min_rate: float, order_by: str) -> list[dict]:
+    """Return one filtered, sorted page of listing rows, cached until the applications table changes."""
+    return get_db().get_application_summaries(limit=limit, offset=offset, company=company,
+                                              min_rate=min_rate, order_by=order_by)
+
+
+@st.cache_data(show_spinner=False)
+def get_top_unmatched_skills(apps_version: tuple, limit: int = 15) -> list[tuple[str, int]]:
+    """Return the most frequently unmatched skills, cached until the applications table changes."""
+    return get_db().get_top_unmatched_skills(limit=limit)
+
+
+@st.cache_data(show_spinner=False)
+def get_distinct_companies(apps_version: tuple) -> list[str]:
+    """Return the sorted company names, cached until the applications table changes."""
+    return get_db().distinct_companies()
+
+
+def invalidate_application_caches() -> None:
+    """Drop cached data derived from the applications table once it has been written to."""
+    for cached in (load_applications_page, get_top_unmatched_skills, get_distinct_companies,
+                   build_daily_stats, build_daily_count_fig, build_match_trend_fig, build_unmatched_fig):
+        cached.clear()
+
+
+def start_of_today() -> datetime:
+    """Return midnight of the current day."""
+    return datetime.combine(datetime.now().date(), datetime.min.time())
+
+
+@st.cache_data(show_spinner=False)
+def build_daily_stats(apps_version: tuple, today, days: int = 10) -> "pd.DataFrame":
+    """
+    Aggregate applications per day over the past `days` days.
+
+    The per-day buckets are computed in SQL, so the chart payload stays bounded
+    regardless of history length. Returns one row per day (oldest first, days
+    without applications included) with the number of applications and their
+    average match rate in percent.
+    """
+    date_range = pd.date_range(end=pd.Timestamp(today), periods=days + 1, freq='D')
+    daily = pd.DataFrame(get_db().get_daily_stats(date_range[0].to_pydatetime()),
+                         columns=['day', 'size', 'mean'])
+    daily = daily.set_index(pd.to_datetime(daily['day'])).reindex(date_range, fill_value=0)
+
+    return pd.DataFrame({
+        'Date': date_range,
+        'Count': daily['size'].astype(int).to_numpy(),
+        'Match Rate': (daily['mean'].astype(float) * 100).to_numpy(),
+    })
+
+
+# Figures are shared as-is rather than copied out of st.cache_data: unpickling a
+# plotly Figure re-validates it, costing more per rerun than serializing the chart.
+# st.plotly_chart only reads the figure, so sharing one instance is safe.
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_daily_count_fig(apps_version: tuple, today):
+    """Build the applications-per-day chart, cached until the table or the day changes."""
+    fig = px.line(build_daily_stats(apps_version, today), x='Date', y='Count',
+                  title='Applications Generated Per Day (Past 10 Days)',
+                  labels={'Count': 'Number of Applications'},
+                  markers=True)
+    fig.update_layout(showlegend=False)
+    fig.update_xaxes(tickformat='%b %d')
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_match_trend_fig(apps_version: tuple, today):
+    """Build the daily average match rate chart, cached until the table or the day changes."""
+    fig = px.line(build_daily_stats(apps_version, today), x='Date', y='Match Rate',
+                  title='Daily Average Match Rate (Past 10 Days)',
+                  labels={'Match Rate': 'Match Rate (%)'})
+    fig.update_layout(showlegend=False)
+    fig.update_xaxes(tickformat='%b %d')
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_unmatched_fig(apps_version: tuple):
+    """Build the most unmatched skills bar chart, cached until the applications table changes."""
+    unmatched_df = pd.DataFrame(get_top_unmatched_skills(apps_version)[:10], columns=['Skill', 'Frequency'])
+    fig = px.bar(unmatched_df, x='Skill', y='Frequency',
+                 title='Top 10 Most Unmatched Skills',
+                 labels={'Frequency': 'Number of Applications Missing This Skill'})
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+@st.cache_resource
+def get_generation_executor() -> ThreadPoolExecutor:
+    """Return the process-wide worker pool used to run job application processing."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="generation")
+
+
+@st.fragment(run_every=1.0)
+def watch_generation_progress() -> None:
+    """Show progress while the background generation runs and rerun the app once it finishes."""
+    generation_future = st.session_state.get('generation_future')
+    if generation_future is None or generation_future.done():
+        st.rerun()
+    st.info("⏳ Analyzing job offer and generating documents...")
 
 
 def show_historics_page():
@@ -235,151 +451,182 @@ def show_historics_page():
     st.title("Historics")
     st.caption("View all applications in table format")
 
-    db = ApplicationDatabase()
-    applications = db.get_all_applications()
-
-    if not applications:
+    db = get_db()
+    if not db.get_application_count():
         st.info("No applications found. Generate your first application on the main page!")
         return
 
-    try:
-        import pandas as pd
-    except ImportError:
+    apps_version = db.get_data_version()
+
+    # Filtering and sorting run in SQL; only the current page is fetched
+    filter_col1, filter_col2, filter_col3 = st.columns(3)
+    with filter_col1:
+        company_filter = st.selectbox("Filter by Company", ["All"] + get_distinct_companies(apps_version))
+    with filter_col2:
+        min_rate = st.slider("Minimum Match Rate", min_value=0, max_value=100, value=0, step=5, format="%d%%") / 100
+    with filter_col3:
+        order_by = st.selectbox("Sort by", list(HISTORICS_SORT_OPTIONS), format_func=HISTORICS_SORT_OPTIONS.get)
+    company = None if company_filter == "All" else company_filter
+    total_applications = db.get_application_count(company=company, min_rate=min_rate)
+
+    # Only fetch the rows of the current page (reused across reruns until the table changes)
+    page_size = st.select_slider("Rows per page", options=HISTORICS_PAGE_SIZES, value=50)
+    page_count = max(1, math.ceil(total_applications / page_size))
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    st.caption(f"Page {page} of {page_count}")
+    applications = load_applications_page(apps_version, page_size, (page - 1) * page_size, company, min_rate, order_by)
+
+    if pd is None:
         st.error("Pandas is required for table view. Install with: pip install pandas")
         return
 
-    # Create DataFrame from applications
-    data = []
-    for app in applications:
-        data.append({
-            'Date': app.created_at.strftime('%Y-%m-%d'),
-            'Company': app.company,
-            'Position': app.position,
-            'Location': app.location,
-            'Match Rate': f"{app.matching_rate:.1%}",
-            'Matched Skills': len(app.matched_skills),
-            'Unmatched Skills': len(app.unmatched_skills),
-            'Cost': f"${app.application_cost:.4f}",
-            'ID': app.id
-        })
-
-    df = pd.DataFrame(data)
-
-    # Display table
-    st.subheader(f"All Applications ({len(df)})")
-    st.dataframe(
-        df.drop('ID', axis=1),
+    # Build the table column-wise, formatting each column in a single pass
+    apps_df = pd.DataFrame.from_records(applications, columns=[
+        'created_at', 'company', 'position', 'location', 'matching_rate',
+        'matched_count', 'unmatched_count', 'application_cost',
+    ])
+    df = pd.DataFrame({
+        'Date': pd.to_datetime(apps_df['created_at']).dt.strftime('%Y-%m-%d'),
+        'Company': apps_df['company'],
+        'Position': apps_df['position'],
+        'Location': apps_df['location'],
+        'Match Rate': apps_df['matching_rate'].map('{:.1%}'.format),
+        'Matched Skills': apps_df['matched_count'],
+        'Unmatched Skills': apps_df['unmatched_count'],
+        'Cost': apps_df['application_cost'].map('${:.4f}'.format),
+    })
+
+    # Display table - selecting a row opens its details below. A selection is a row index
+    # into the listed page, so the key changes with the page, filters, sort and table
+    # contents: a new view starts unselected instead of pointing at another application
+    st.subheader(f"All Applications ({total_applications})")
+    table_view = (company_filter, min_rate, order_by, page_size, page, apps_version)
+    table_event = st.dataframe(
+        df,
         use_container_width=True,
         hide_index=True,
-        height=600
+        height=600,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"apps_table_{hash(table_view)}"
     )
 
     # Action buttons section
     st.subheader("Actions")
 
-    selected_id = st.selectbox(
-        "Select an application to view details:",
-        options=[app.id for app in applications],
-        format_func=lambda x: next((f"{app.company} - {app.position}" for app in applications if app.id == x), "Unknown")
-    )
-
-    if selected_id:
-        selected_app = next((app for app in applications if app.id == selected_id), None)
-        if selected_app:
-            # Use a card-like container
-            with st.container(border=True):
-                col1, col2 = st.columns([3, 1])
-
-                with col1:
-                    # Header with company and position
-                    st.markdown(f"### {selected_app.company}")
-                    st.caption(f"{selected_app.position} • {selected_app.location}")
-
-                    # Key metrics in a row
-                    met_col1, met_col2, met_col3 = st.columns(3)
-                    with met_col1:
-                        st.metric("Match Rate", f"{selected_app.matching_rate:.1%}")
-                    with met_col2:
-                        st.metric("Cost", f"${selected_app.application_cost:.4f}")
-                    with met_col3:
-                        st.metric("Date", selected_app.created_at.strftime('%Y-%m-%d'))
-
-                    # Skills section
-                    if selected_app.matched_skills or selected_app.unmatched_skills:
-                        st.divider()
-                        if selected_app.matched_skills:
-                            st.write("**Matched Skills**")
-                            st.write(" ".join([f"`{skill}`" for skill in selected_app.matched_skills]))
-
-                        if selected_app.unmatched_skills:
-                            st.write("**Skills to Develop**")
-                            st.write(" ".join([f"`{skill}`" for skill in selected_app.unmatched_skills]))
-
-                    # PDF Download section
-                    if selected_app.cv_pdf or selected_app.cover_letter_pdf:
-                        st.divider()
-                        st.write("**Downloads**")
-                        pdf_col1, pdf_col2 = st.columns(2)
-
-                        with pdf_col1:
-                            if selected_app.cv_pdf:
-                                st.download_button(
-                                    label="📄 Download CV",
-                                    data=selected_app.cv_pdf,
-                                    file_name=f"CV_{selected_app.company}_{selected_app.position.replace(' ', '_')}.pdf",
-                                    mime="application/pdf",
-                                    use_container_width=True
-                                )
-                            else:
-                                st.caption("❌ CV PDF not available")
-
-                        with pdf_col2:
-                            if selected_app.cover_letter_pdf:
-                                st.download_button(
-                                    label="📄 Download Cover Letter",
-                                    data=selected_app.cover_letter_pdf,
-                                    file_name=f"CoverLetter_{selected_app.company}_{selected_app.position.replace(' ', '_')}.pdf",
-                                    mime="application/pdf",
-                                    use_container_width=True
-                                )
-                            else:
-                                st.caption("❌ Cover Letter PDF not available")
-
-                    # PDF Preview section
-                    if selected_app.cv_pdf or selected_app.cover_letter_pdf:
-                        st.divider()
-                        st.write("**Preview Documents**")
-                        preview_col1, preview_col2 = st.columns(2)
-
-                        with preview_col1:
-                            if selected_app.cv_pdf:
-                                with st.expander("📄 Preview CV", expanded=False):
+    selected_rows = table_event.selection.rows
+    if selected_rows:
+        # The page is listed from lightweight rows; only the selected application is loaded,
+        # and its PDFs stay in the database until they are downloaded or previewed
+        selected_id = applications[selected_rows[0]]['id']
+        selected_app = db.get_application(selected_id, include_pdfs=False)
+        has_cv_pdf, has_cover_letter_pdf = db.get_pdf_availability(selected_id)
+        # Use a card-like container
+        with st.container(border=True):
+            col1, col2 = st.columns([3, 1])
+
+            with col1:
+                # Header with company and position
+                st.markdown(f"### {selected_app.company}")
+                st.caption(f"{selected_app.position} • {selected_app.location}")
+
+                # Key metrics in a row
+                met_col1, met_col2, met_col3 = st.columns(3)
+                with met_col1:
+                    st.metric("Match Rate", f"{selected_app.matching_rate:.1%}")
+                with met_col2:
+                    st.metric("Cost", f"${selected_app.application_cost:.4f}")
+                with met_col3:
+                    st.metric("Date", selected_app.created_at.strftime('%Y-%m-%d'))
+
+                # Skills section
+                if selected_app.matched_skills or selected_app.unmatched_skills:
+                    st.divider()
+                    if selected_app.matched_skills:
+                        st.write("**Matched Skills**")
+                        st.write(" ".join([f"`{skill}`" for skill in selected_app.matched_skills]))
+
+                    if selected_app.unmatched_skills:
+                        st.write("**Skills to Develop**")
+                        st.write(" ".join([f"`{skill}`" for skill in selected_app.unmatched_skills]))
+
+                # PDF Download section
+                if has_cv_pdf or has_cover_letter_pdf:
+                    st.divider()
+                    st.write("**Downloads**")
+                    pdf_col1, pdf_col2 = st.columns(2)
+
+                    with pdf_col1:
+                        if has_cv_pdf:
+                            st.download_button(
+                                label="📄 Download CV",
+                                data=functools.partial(db.get_pdf_by_id, selected_id, "cv"),
+                                file_name=f"CV_{selected_app.company}_{selected_app.position.replace(' ', '_')}.pdf",
+                                mime="application/pdf",
+                                use_container_width=True,
+                                on_click="ignore"
+                            )
+                        else:
+                            st.caption("❌ CV PDF not available")
+
+                    with pdf_col2:
+                        if has_cover_letter_pdf:
+                            st.download_button(
+                                label="📄 Download Cover Letter",
+                                data=functools.partial(db.get_pdf_by_id, selected_id, "cover_letter"),
+                                file_name=f"CoverLetter_{selected_app.company}_{selected_app.position.replace(' ', '_')}.pdf",
+                                mime="application/pdf",
+                                use_container_width=True,
+                                on_click="ignore"
+                            )
+                        else:
+                            st.caption("❌ Cover Letter PDF not available")
+
+                # PDF Preview section
+                if has_cv_pdf or has_cover_letter_pdf:
+                    st.divider()
+                    st.write("**Preview Documents**")
+                    preview_col1, preview_col2 = st.columns(2)
+
+                    with preview_col1:
+                        if has_cv_pdf:
+                            # Expander bodies run even when collapsed, so only load the PDF while open
+                            with st.expander("📄 Preview CV", expanded=False, key="preview_cv",
+                                             on_change="rerun") as cv_preview:
+                                if cv_preview.open:
                                     display_pdf_preview(
-                                        selected_app.cv_pdf,
+                                        db.get_pdf_by_id(selected_id, "cv"),
                                         pdf_type="CV"
                                     )
-                            else:
-                                st.caption("❌ CV PDF not available for preview")
+                        else:
+                            st.caption("❌ CV PDF not available for preview")
 
-                        with preview_col2:
-                            if selected_app.cover_letter_pdf:
-                                with st.expander("📄 Preview Cover Letter", expanded=False):
+                    with preview_col2:
+                        if has_cover_letter_pdf:
+                            with st.expander("📄 Preview Cover Letter", expanded=False, key="preview_cover_letter",
+                                             on_change="rerun") as cover_letter_preview:
+                                if cover_letter_preview.open:
                                     display_pdf_preview(
-                                        selected_app.cover_letter_pdf,
+                                        db.get_pdf_by_id(selected_id, "cover_letter"),
                                         pdf_type="Cover Letter"
                                     )
-                            else:
-                                st.caption("❌ Cover Letter PDF not available for preview")
-
-                with col2:
-                    if st.button("Delete", type="secondary", use_container_width=True):
-                        if db.delete_application(selected_id):
-                            st.success("Deleted!")
-                            st.rerun()
                         else:
-                            st.error("Failed to delete")
+                            st.caption("❌ Cover Letter PDF not available for preview")
+
+            with col2:
+                if st.button("Delete", key="delete_app", type="secondary", use_container_width=True):
+                    if db.delete_application(selected_id):
+                        invalidate_application_caches()
+                        st.success("Deleted!")
+                        st.rerun()
+                    else:
+                        st.error("Failed to delete")
+                view_offer = st.button("View Offer", key="view_offer", use_container_width=True)
+
+            if view_offer:
+                st.text_area("Job Offer", selected_app.job_offer_input, height=300, disabled=True)
     else:
-        st.info("Select an application to view details")
+        st.info("Select a row in the table to view application details")
 
 
 def show_template_editor_page():
@@ -469,14 +716,17 @@ def show_template_editor_page():
                     # Download preview as PDF button - centered and constrained to match A4 width
                     col_spacer_l, col_btn, col_spacer_r = st.columns([0.1, 0.8, 0.1])
                     with col_btn:
-                        if st.button("Download Preview (PDF)", key=f"download_preview_{file_path}", use_container_width=True, type="primary"):
-                            try:
-                                preview_pdf = convert_html_to_pdf(edited_content)
-                                filename = f"Preview_{file_path.split('/')[-1].replace('.html', '')}.pdf"
-                                saved_path = save_file_to_applications(preview_pdf, filename, "Template Preview PDF")
-                                st.success(f"Saved to {saved_path}")
-                            except Exception as e:
-                                st.error(f"Error downloading preview: {str(e)}")
+                        # Rendered only when clicked, and the download does not rerun the page
+                        st.download_button(
+                            "Download Preview (PDF)",
+                            data=functools.partial(convert_html_to_pdf, edited_content),
+                            file_name=f"Preview_{file_path.split('/')[-1].replace('.html', '')}.pdf",
+                            mime="application/pdf",
+                            key=f"download_preview_{file_path}",
+                            use_container_width=True,
+                            type="primary",
+                            on_click="ignore"
+                        )
 
             else:
                 # For YAML, just show editor
@@ -502,7 +752,7 @@ def show_template_editor_page():
 
                         if "YAML" in tab_name:
                             try:
-                                yaml.safe_load(edited_content)
+                                yaml.load(edited_content, Loader=YAML_LOADER)
                             except yaml.YAMLError as e:
                                 is_valid = False
                                 error_msg = f"YAML Syntax Error: {str(e)}"
@@ -534,26 +784,95 @@ def show_template_editor_page():
                 st.caption("No changes made")
 
 
+@st.fragment
+def show_activity_trends(apps_version: tuple, today) -> None:
+    """Plot applications per day and the daily match rate, rerunning independently of the page."""
+    # Applications generated per day (past 10 days)
+    st.plotly_chart(build_daily_count_fig(apps_version, today), use_container_width=True)
+
+    # Match rate trend - daily average
+    st.plotly_chart(build_match_trend_fig(apps_version, today), use_container_width=True)
+
+
+@st.fragment
+def show_skills_gap(apps_version: tuple, total_count: int) -> None:
+    """Show the skills gap analysis and development insights, rerunning independently of the page."""
+    # Most unmatched skills indicator
+    st.subheader("Skills Gap Analysis")
+
+    # Aggregate all unmatched skills in SQL (most common first)
+    sorted_unmatched = get_top_unmatched_skills(apps_version)
+
+    if sorted_unmatched:
+        col_unmatched1, col_unmatched2 = st.columns([2, 1])
+
+        with col_unmatched1:
+            # Bar chart of most unmatched skills
+            st.plotly_chart(build_unmatched_fig(apps_version), use_container_width=True)
+
+        with col_unmatched2:
+            st.write("**Skills Development Priority:**")
+            st.markdown("\n".join(
+                f"{i}. **{skill}** - Missing in {count}/{total_count} applications ({count / total_count * 100:.1f}%)"
+                for i, (skill, count) in enumerate(sorted_unmatched[:5], 1)
+            ))
+
+            if len(sorted_unmatched) > 5:
+                with st.expander("View more unmatched skills"):
+                    st.markdown("\n".join(
+                        f"{i}. {skill} - {count} applications ({count / total_count * 100:.1f}%)"
+                        for i, (skill, count) in enumerate(sorted_unmatched[5:15], 6)
+                    ))
+    else:
+        st.info("No unmatched skills data available.")
+
+    # Skills improvement insights
+    if sorted_unmatched:
+        st.subheader("Development Insights")
+        most_missed = sorted_unmatched[0] if sorted_unmatched else None
+
+        if most_missed:
+            skill_name, miss_count = most_missed
+            miss_percentage = (miss_count / total_count) * 100
+
+            col_insight1, col_insight2 = st.columns(2)
+
+            with col_insight1:
+                st.metric(
+                    label="Most Missed Skill",
+                    value=skill_name,
+                    delta=f"Missing in {miss_percentage:.1f}% of applications"
+                )
+
+            with col_insight2:
+                # Calculate potential improvement in match rate
+                if miss_count > 0:
+                    avg_improvement = miss_count / total_count * 100
+                    st.metric(
+                        label="Potential Match Rate Improvement",
+                        value=f"+{avg_improvement:.1f}%",
+                        delta="If this skill is acquired"
+                    )
+
+
 def show_follow_up_page():
     """Display the application follow-up page"""
     st.title("Data Visualization")
     st.subheader("Total Metrics")
 
-    db = ApplicationDatabase()
-    applications = db.get_all_applications()
+    db = get_db()
+    # Summary metrics, aggregated in SQL
+    total_count, total_cost, avg_match_rate = db.get_summary_since()
 
-    if not applications:
+    if not total_count:
         st.info("No applications found. Generate your first application on the main page!")
         return
 
-    # Summary metrics
-    total_cost = db.get_total_cost()
-    avg_match_rate = sum(app.matching_rate for app in applications) / len(applications)
-    avg_cost = total_cost / len(applications) if len(applications) > 0 else 0
+    avg_cost = total_cost / total_count
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Applications", len(applications))
+        st.metric("Total Applications", total_count)
     with col2:
         st.metric("Average Match", f"{avg_match_rate:.1%}")
     with col3:
@@ -565,17 +884,14 @@ def show_follow_up_page():
     st.divider()
     st.subheader("Today's Metrics")
 
-    today = datetime.now().date()
-    today_applications = [app for app in applications if app.created_at.date() == today]
+    today_count, today_total_cost, today_avg_match_rate = db.get_summary_since(start_of_today())
 
-    if today_applications:
-        today_total_cost = sum(app.application_cost for app in today_applications)
-        today_avg_match_rate = sum(app.matching_rate for app in today_applications) / len(today_applications)
-        today_avg_cost = today_total_cost / len(today_applications) if len(today_applications) > 0 else 0
+    if today_count:
+        today_avg_cost = today_total_cost / today_count
 
         col_today1, col_today2, col_today3, col_today4 = st.columns(4)
         with col_today1:
-            st.metric("Total Applications", len(today_applications))
+            st.metric("Total Applications", today_count)
         with col_today2:
             st.metric("Average Match", f"{today_avg_match_rate:.1%}")
         with col_today3:
@@ -586,128 +902,19 @@ def show_follow_up_page():
         st.info("No applications generated today")
 
     # Analytics section
-    if len(applications) >= 3:  # Only show analytics if we have enough data
+    if total_count >= 3:  # Only show analytics if we have enough data
         st.subheader("Analytics")
 
-        try:
-            import plotly.express as px
-            import pandas as pd
-        except ImportError:
+        if px is None or pd is None:
             st.error("Plotly and pandas are required for analytics. Install with: pip install plotly pandas")
             return
 
-        # Applications generated per day (past 10 days)
-        # Generate all dates for the past 10 days
-        from datetime import timedelta
+        # Figures are rebuilt only when the applications table (or the day) changes
+        apps_version = db.get_data_version()
         today = datetime.now().date()
-        date_range = [today - timedelta(days=i) for i in range(10, -1, -1)]
-
-        apps_by_date_gen = sorted(applications, key=lambda x: x.created_at)
-        daily_counts = pd.DataFrame({
-            'Date': [app.created_at.date() for app in apps_by_date_gen]
-        }).groupby('Date').size().reset_index(name='Count')
-
-        # Create a complete date range DataFrame and merge with actual counts
-        date_range_df = pd.DataFrame({'Date': date_range})
-        daily_counts_complete = date_range_df.merge(daily_counts, on='Date', how='left').fillna(0)
-        daily_counts_complete['Count'] = daily_counts_complete['Count'].astype(int)
-
-        fig_daily = px.line(daily_counts_complete, x='Date', y='Count',
-                           title='Applications Generated Per Day (Past 10 Days)',
-                           labels={'Count': 'Number of Applications'},
-                           markers=True)
-        fig_daily.update_layout(showlegend=False)
-        fig_daily.update_xaxes(tickformat='%b %d')
-        st.plotly_chart(fig_daily, use_container_width=True)
-
-        # Match rate trend - calculate daily average
-        apps_by_date = sorted(applications, key=lambda x: x.created_at)
-
-        # Group applications by date and calculate average match rate
-        daily_match_rates = pd.DataFrame({
-            'Date': [app.created_at.date() for app in apps_by_date],
-            'Match Rate': [app.matching_rate * 100 for app in apps_by_date]
-        }).groupby('Date')['Match Rate'].mean().reset_index()
-
-        # Create a complete date range DataFrame and merge with actual match rates
-        date_range_df = pd.DataFrame({'Date': date_range})
-        daily_match_rates_complete = date_range_df.merge(daily_match_rates, on='Date', how='left').fillna(0)
-
-        fig = px.line(daily_match_rates_complete, x='Date', y='Match Rate',
-                     title='Daily Average Match Rate (Past 10 Days)',
-                     labels={'Match Rate': 'Match Rate (%)'})
-        fig.update_layout(showlegend=False)
-        fig.update_xaxes(tickformat='%b %d')
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Most unmatched skills indicator
-        st.subheader("Skills Gap Analysis")
-
-        # Aggregate all unmatched skills
-        unmatched_skills_counter = {}
-        for app in applications:
-            for skill in app.unmatched_skills:
-                unmatched_skills_counter[skill] = unmatched_skills_counter.get(skill, 0) + 1
-
-        if unmatched_skills_counter:
-            # Sort by frequency (most common first)
-            sorted_unmatched = sorted(unmatched_skills_counter.items(), key=lambda x: x[1], reverse=True)
-
-            # Create DataFrame for visualization
-            unmatched_df = pd.DataFrame(sorted_unmatched[:10], columns=['Skill', 'Frequency'])
-
-            col_unmatched1, col_unmatched2 = st.columns([2, 1])
-
-            with col_unmatched1:
-                # Bar chart of most unmatched skills
-                fig_unmatched = px.bar(unmatched_df, x='Skill', y='Frequency',
-                                     title='Top 10 Most Unmatched Skills',
-                                     labels={'Frequency': 'Number of Applications Missing This Skill'})
-                fig_unmatched.update_xaxes(tickangle=45)
-                st.plotly_chart(fig_unmatched, use_container_width=True)
-
-            with col_unmatched2:
-                st.write("**Skills Development Priority:**")
-                for i, (skill, count) in enumerate(sorted_unmatched[:5], 1):
-                    percentage = (count / len(applications)) * 100
-                    st.write(f"{i}. **{skill}** - Missing in {count}/{len(applications)} applications ({percentage:.1f}%)")
-
-                if len(sorted_unmatched) > 5:
-                    with st.expander("View more unmatched skills"):
-                        for i, (skill, count) in enumerate(sorted_unmatched[5:15], 6):
-                            percentage = (count / len(applications)) * 100
-                            st.write(f"{i}. {skill} - {count} applications ({percentage:.1f}%)")
-        else:
-            st.info("No unmatched skills data available.")
-
-        # Skills improvement insights
-        if unmatched_skills_counter:
-            st.subheader("Development Insights")
-            total_apps = len(applications)
-            most_missed = sorted_unmatched[0] if sorted_unmatched else None
 
-            if most_missed:
-                skill_name, miss_count = most_missed
-                miss_percentage = (miss_count / total_apps) * 100
-
-                col_insight1, col_insight2 = st.columns(2)
-
-                with col_insight1:
-                    st.metric(
-                        label="Most Missed Skill",
-                        value=skill_name,
-                        delta=f"Missing in {miss_percentage:.1f}% of applications"
-                    )
-
-                with col_insight2:
-                    # Calculate potential improvement in match rate
-                    if miss_count > 0:
-                        avg_improvement = miss_count / total_apps * 100
-                        st.metric(
-                            label="Potential Match Rate Improvement",
-                            value=f"+{avg_improvement:.1f}%",
-                            delta="If this skill is acquired"
-                        )
+        show_activity_trends(apps_version, today)
+        show_skills_gap(apps_version, total_count)
 
 
 def main():
@@ -719,267 +926,11 @@ def main():
         initial_sidebar_state="expanded"
     )
 
+    # Create the renderer up front so the browser launches in the background
+    get_pdf_renderer()
+
     # Custom color theme
-    st.markdown("""
-    <style>
-        :root {
-            --primary-dark: #0D1821;
-            --accent-teal: #0F7173;
-            --background-light: #F0F4EF;
-        }
-
-        /* Main background */
-        .main {
-            background-color: #0D1821;
-            color: #F0F4EF;
-        }
-
-        /* Sidebar */
-        [data-testid="sidebar"] {
-            background-color: #0D1821;
-        }
-
-        /* Text elements */
-        h1, h2, h3, h4, h5, h6 {
-            color: #F0F4EF;
-        }
-
-        p, span, div, label {
-            color: #F0F4EF !important;
-        }
-
-        /* Force white text in main content area */
-        .main p, .main span, .main label, .main caption {
-            color: #F0F4EF !important;
-        }
-
-        /* Primary buttons (active tab) */
-        .stButton > button[kind="primary"] {
-            background-color: #0F7173;
-            color: #F0F4EF;
-            font-weight: 700;
-            transition: background-color 0.2s ease;
-            text-decoration: none;
-            border: none;
-        }
-
-        .stButton > button[kind="primary"]:hover {
-            background-color: rgba(15, 113, 115, 0.8);
-            color: #F0F4EF;
-        }
-
-        /* Secondary buttons (inactive tab) */
-        .stButton > button[kind="secondary"] {
-            background-color: transparent;
-            color: #F0F4EF;
-            font-weight: normal;
-            transition: all 0.2s ease;
-            border: 1px solid #0F7173;
-        }
-
-        .stButton > button[kind="secondary"]:hover {
-            background-color: rgba(15, 113, 115, 0.2);
-            color: #F0F4EF;
-            border-color: #0F7173;
-        }
-
-        /* Input fields - general default */
-        input,
-        textarea,
-        select {
-            border-color: #0F7173 !important;
-            background-color: #0D1821 !important;
-            color: #F0F4EF !important;
-        }
-
-        /* Input fields */
-        .stTextInput > div > div > input,
-        .stTextArea > div > div > textarea,
-        .stSelectbox > div > div > select,
-        .stMultiSelect > div > div > select {
-            border: 2px solid #0F7173 !important;
-            background-color: #0D1821 !important;
-            color: #F0F4EF !important;
-        }
-
-        /* General input focus state */
-        input:focus,
-        textarea:focus,
-        select:focus {
-            border-top-color: #0F7173 !important;
-            border-right-color: #0F7173 !important;
-            border-bottom-color: #0F7173 !important;
-            border-left-color: #0F7173 !important;
-            outline: none !important;
-            background-color: #0D1821 !important;
-        }
-
-        /* Input fields focus state */
-        .stTextInput > div > div > input:focus,
-        .stTextArea > div > div > textarea:focus,
-        .stSelectbox > div > div > select:focus,
-        .stMultiSelect > div > div > select:focus {
-            border-top-color: #0F7173 !important;
-            border-right-color: #0F7173 !important;
-            border-bottom-color: #0F7173 !important;
-            border-left-color: #0F7173 !important;
-            outline: none !important;
-            box-shadow: 0 0 0 3px rgba(15, 113, 115, 0.2) !important;
-            background-color: #0D1821 !important;
-        }
-
-        /* Streamlit textarea focus state */
-        .stTextAreaRootElement:focus,
-        .st-b5:focus,
-        .st-b3:focus,
-        .st-b4:focus,
-        .st-b6:focus {
-            border-top-color: #0F7173 !important;
-            border-right-color: #0F7173 !important;
-            border-bottom-color: #0F7173 !important;
-            border-left-color: #0F7173 !important;
-            outline: none !important;
-            box-shadow: 0 0 0 3px rgba(15, 113, 115, 0.2) !important;
-        }
-
-        /* Streamlit wrapper classes focus state */
-        .st-b3:focus,
-        .st-b4:focus,
-        .st-b5:focus,
-        .st-b6:focus {
-            border-top-color: #0F7173 !important;
-            border-right-color: #0F7173 !important;
-            border-bottom-color: #0F7173 !important;
-            border-left-color: #0F7173 !important;
-            outline: none !important;
-            box-shadow: 0 0 0 3px rgba(15, 113, 115, 0.2) !important;
-        }
-
-        /* Info/success/warning/error messages */
-        .stAlert {
-            background-color: rgba(15, 113, 115, 0.15);
-            color: #F0F4EF;
-            border: 2px solid #0F7173;
-        }
-
-        /* Override default Streamlit error styling (red) with teal */
-        [data-testid="stAlert"] {
-            background-color: rgba(15, 113, 115, 0.15) !important;
-            border-color: #0F7173 !important;
-            color: #F0F4EF !important;
-        }
-
-        /* Override error icon and text colors */
-        [data-testid="stAlert"] svg {
-            color: #0F7173 !important;
-            fill: #0F7173 !important;
-        }
-
-        [data-testid="stAlert"] > * {
-            color: #F0F4EF !important;
-        }
-
-        /* Streamlit error container */
-        .st-emotion-cache-1v0mbdj {
-            background-color: rgba(15, 113, 115, 0.15) !important;
-            border: 2px solid #0F7173 !important;
-            color: #F0F4EF !important;
-        }
-
-        /* Danger/error state override */
-        [role="alert"] {
-            background-color: rgba(15, 113, 115, 0.15) !important;
-            border-color: #0F7173 !important;
-            color: #F0F4EF !important;
-        }
-
-        [role="alert"] svg {
-            color: #0F7173 !important;
-            fill: #0F7173 !important;
-        }
-
-        /* Metric containers */
-        .stMetric {
-            background-color: rgba(15, 113, 115, 0.15);
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #0F7173;
-        }
-
-        /* Dividers */
-        .stHorizontalBlock {
-            border-color: #0F7173;
-        }
-
-        hr {
-            border-color: #0F7173 !important;
-        }
-
-        /* Tabs */
-        .stTabs [role="tablist"] {
-            border-color: #0F7173;
-        }
-
-        .stTabs [role="tab"] {
-            color: #F0F4EF;
-            border-bottom-color: transparent;
-        }
-
-        .stTabs [role="tab"][aria-selected="true"] {
-            color: #F0F4EF;
-            border-bottom-color: #0F7173;
-            font-weight: 600;
-        }
-
-        /* Expander */
-        .streamlit-expanderHeader {
-            background-color: rgba(15, 113, 115, 0.15);
-            color: #F0F4EF;
-        }
-
-        /* Code blocks */
-        .stCodeBlock {
-            background-color: #0D1821;
-            color: #F0F4EF;
-            border: 1px solid #0F7173;
-        }
-
-        /* Caption and help text */
-        .stCaption, .stHelp {
-            color: #F0F4EF;
-        }
-
-        /* DataFrames */
-        .streamlit-dataframe {
-            background-color: #0D1821;
-            color: #F0F4EF;
-        }
-
-        /* Plotly charts background */
-        .plotly-graph-div {
-            background-color: transparent;
-        }
-
-        /* Custom scrollbar */
-        ::-webkit-scrollbar {
-            width: 10px;
-            height: 10px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: #0D1821;
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: #0F7173;
-            border-radius: 5px;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: rgba(15, 113, 115, 0.8);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_theme_css(THEME_CSS_PATH, os.path.getmtime(THEME_CSS_PATH))}</style>", unsafe_allow_html=True)
 
     # Initialize session state for page tracking
     if 'current_page' not in st.session_state:
@@ -1048,9 +999,7 @@ def main():
     default_profile_path = "templates/user_profile.yaml"
 
     if os.path.exists(default_profile_path):
-        with open(default_profile_path, 'r', encoding='utf-8') as f:
-            profile_data = yaml.safe_load(f)
-        user_profile = UserProfile(**profile_data)
+        user_profile = load_default_profile(default_profile_path, os.path.getmtime(default_profile_path))
         st.sidebar.caption(f"Profile: {user_profile.personal_info.name}")
     else:
         uploaded_profile = st.sidebar.file_uploader(
@@ -1059,13 +1008,24 @@ def main():
             help="Upload a YAML file with your profile information"
         )
         if uploaded_profile:
-            profile_data = yaml.safe_load(uploaded_profile)
-            user_profile = UserProfile(**profile_data)
+            user_profile = load_uploaded_profile(uploaded_profile.getvalue())
             st.sidebar.caption(f"Profile: {user_profile.personal_info.name}")
         else:
             st.sidebar.info("Please upload a profile file")
             st.stop()
 
+    auto_save_pdfs = st.sidebar.toggle(
+        "Auto-save PDFs",
+        value=True,
+        key="auto_save_pdfs",
+        help="Render and save both PDFs right after generation. When off, each PDF is rendered only when downloaded."
+    )
+    use_response_cache = st.sidebar.toggle(
+        "Reuse cached responses",
+        value=True,
+        help="Serve the analysis of an already seen job offer from the cache. Turn off to regenerate it with fresh API calls."
+    )
+
     # Main content area
     col1, col2 = st.columns([1, 1])
 
@@ -1121,23 +1081,21 @@ def main():
     st.sidebar.subheader("Session Info")
 
     cost_tracker = get_cost_tracker()
-    db = ApplicationDatabase()
-    applications = db.get_all_applications()
+    db = get_db()
+    storage_info = db.get_pdf_storage_info()
 
     if cost_tracker.total_calls > 0:
         st.sidebar.metric("Session Cost", f"${cost_tracker.total_cost:.4f}")
 
-    if applications:
+    if storage_info["total_records"]:
 
         # Today's metrics
-        today = datetime.now().date()
-        today_applications = [app for app in applications if app.created_at.date() == today]
+        today_count, today_total_cost, _ = db.get_summary_since(start_of_today())
 
-        if today_applications:
-            today_total_cost = sum(app.application_cost for app in today_applications)
-            today_avg_cost = today_total_cost / len(today_applications) if len(today_applications) > 0 else 0
+        if today_count:
+            today_avg_cost = today_total_cost / today_count
 
-            st.sidebar.metric("Today's Applications", len(today_applications))
+            st.sidebar.metric("Today's Applications", today_count)
             st.sidebar.metric("Today's Avg Cost", f"${today_avg_cost:.4f}")
         else:
             st.sidebar.caption("No applications today")
@@ -1145,7 +1103,6 @@ def main():
     # PDF Storage Info
     st.sidebar.divider()
     st.sidebar.subheader("PDF Storage")
-    storage_info = db.get_pdf_storage_info()
     st.sidebar.metric("Total Applications", storage_info["total_records"])
     st.sidebar.metric("CVs Stored", storage_info["cv_pdf_count"])
     st.sidebar.metric("Cover Letters", storage_info["cover_letter_pdf_count"])
@@ -1163,77 +1120,115 @@ def main():
         except Exception as e:
             st.sidebar.error(f"Cleanup error: {str(e)}")
 
-    # Generate button
-    if st.button("Generate CV & Cover Letter", type="primary", use_container_width=True):
+    # Generate button - processing runs in a background thread so the rest of the UI stays responsive
+    generation_future = st.session_state.get('generation_future')
+    if st.button(
+        "Generate CV & Cover Letter",
+        type="primary",
+        use_container_width=True,
+        disabled=generation_future is not None
+    ):
         if not job_offer_text.strip():
             st.error("Please enter a job offer description")
             st.stop()
 
+        # Drop the previous documents now rather than holding them until the new ones replace them
+        for key in GENERATION_RESULT_KEYS:
+            st.session_state.pop(key, None)
+
+        generation_future = get_generation_executor().submit(
+            process_job_application, job_offer_text, user_profile,
+            get_db(), get_template_processor(), get_response_cache() if use_response_cache else None
+        )
+        st.session_state.generation_future = generation_future
+
+    if generation_future is not None and not generation_future.done():
+        watch_generation_progress()
+    elif generation_future is not None:
+        del st.session_state.generation_future
+
         try:
-            with st.spinner("Analyzing job offer and generating documents..."):
-                cv_html, cover_letter_html, job_offer, matched_skills, application_id = process_job_application(job_offer_text, user_profile)
+            cv_html, cover_letter_html, job_offer, matched_skills, application, cost_tracker = generation_future.result()
+            application_id = application.id
 
             # Store in session state for persistence across reruns
             st.session_state.cv_html = cv_html
             st.session_state.cover_letter_html = cover_letter_html
             st.session_state.job_offer = job_offer
             st.session_state.matched_skills = matched_skills
-            st.session_state.application_id = application_id
+            st.session_state.application = application
+            st.session_state.cv_pdf_name, st.session_state.cl_pdf_name = build_pdf_filenames(job_offer)
+
+            # Keep this generation's figures for later reruns
+            if cost_tracker.total_calls > 0 or cost_tracker.cache_hits:
+                st.session_state.generation_costs = (
+                    cost_tracker.total_cost, cost_tracker.total_calls,
+                    cost_tracker.total_tokens, len(cost_tracker.cache_hits)
+                )
 
             st.success(f"Documents generated successfully (ID: {application_id})")
 
             # Auto-download PDFs and play audio
-            auto_download_and_play_audio(cv_html, cover_letter_html, job_offer, application_id)
-
-            st.divider()
-
-            # Display cost information
-            cost_tracker = get_cost_tracker()
-            if cost_tracker.total_calls > 0:
-                with st.expander("Cost Details"):
-                    col_cost1, col_cost2, col_cost3 = st.columns(3)
-                    with col_cost1:
-                        st.metric("Total Cost", f"${cost_tracker.total_cost:.4f}")
-                    with col_cost2:
-                        st.metric("API Calls", cost_tracker.total_calls)
-                    with col_cost3:
-                        st.metric("Tokens", f"{cost_tracker.total_tokens:,}")
-
-            # Display job analysis results
-            st.subheader("Job Analysis")
-
-            col_job, col_skills = st.columns(2)
-
-            with col_job:
-                st.write(f"**Position:** {job_offer.job_title}")
-                st.write(f"**Company:** {job_offer.company_name}")
-                st.write(f"**Location:** {job_offer.location}")
-                st.caption("Required Skills")
-                for skill in job_offer.skills_required:
-                    st.text(f"• {skill}")
-
-            with col_skills:
-                total_required = len(job_offer.skills_required)
-                matched_count = len(matched_skills.matched_skills)
-                match_percentage = (matched_count / total_required * 100) if total_required > 0 else 0.0
-                st.metric("Match Rate", f"{matched_count}/{total_required}")
-                st.metric("Coverage", f"{match_percentage:.0f}%")
-
-                if matched_skills.matched_skills:
-                    st.caption("Matched Skills")
-                    for skill in matched_skills.matched_skills:
-                        st.text(f"• {skill}")
-
-                if len(matched_skills.matched_skills) < len(job_offer.skills_required):
-                    missing_skills = set(job_offer.skills_required) - set(matched_skills.matched_skills)
-                    st.caption("Not Matched")
-                    for skill in missing_skills:
-                        st.text(f"• {skill}")
+            if auto_save_pdfs:
+                auto_download_and_play_audio(
+                    cv_html, cover_letter_html,
+                    st.session_state.cv_pdf_name, st.session_state.cl_pdf_name,
+                    application_id
+                )
+            invalidate_application_caches()
 
         except Exception as e:
             st.error(f"Error generating documents: {str(e)}")
             st.exception(e)
 
+    # Job analysis - drawn from session state so it survives reruns (e.g. opening a preview)
+    if 'job_offer' in st.session_state and 'application' in st.session_state:
+        job_offer = st.session_state.job_offer
+        matched_skills = st.session_state.matched_skills
+        application = st.session_state.application
+
+        st.divider()
+
+        # Display cost information
+        if 'generation_costs' in st.session_state:
+            total_cost, total_calls, total_tokens, cache_hits = st.session_state.generation_costs
+            with st.expander("Cost Details"):
+                col_cost1, col_cost2, col_cost3, col_cost4 = st.columns(4)
+                with col_cost1:
+                    st.metric("Total Cost", f"${total_cost:.4f}")
+                with col_cost2:
+                    st.metric("API Calls", total_calls)
+                with col_cost3:
+                    st.metric("Tokens", f"{total_tokens:,}")
+                with col_cost4:
+                    st.metric("Cache Hits", cache_hits)
+
+        # Display job analysis results
+        st.subheader("Job Analysis")
+
+        col_job, col_skills = st.columns(2)
+
+        with col_job:
+            st.write(f"**Position:** {job_offer.job_title}")
+            st.write(f"**Company:** {job_offer.company_name}")
+            st.write(f"**Location:** {job_offer.location}")
+            # One element per list rather than one per skill
+            st.caption("Required Skills")
+            st.text("\n".join(f"• {skill}" for skill in job_offer.skills_required))
+
+        with col_skills:
+            # The match rate and unmatched skills were computed once when the application was saved
+            st.metric("Match Rate", f"{len(matched_skills.matched_skills)}/{len(job_offer.skills_required)}")
+            st.metric("Coverage", f"{application.matching_rate:.0%}")
+
+            if matched_skills.matched_skills:
+                st.caption("Matched Skills")
+                st.text("\n".join(f"• {skill}" for skill in matched_skills.matched_skills))
+
+            if application.unmatched_skills:
+                st.caption("Not Matched")
+                st.text("\n".join(f"• {skill}" for skill in application.unmatched_skills))
+
     # Preview section - available if documents exist in session state
     if hasattr(st.session_state, 'cv_html') and hasattr(st.session_state, 'cover_letter_html'):
         st.subheader("Document Preview")
@@ -1242,13 +1237,38 @@ def main():
         cv_html = st.session_state.cv_html
         cover_letter_html = st.session_state.cover_letter_html
 
-        with st.expander("Preview CV"):
-            cv_wrapped = f'<div style="background-color: white; padding: 20px; border-radius: 8px;">{cv_html}</div>'
-            st.components.v1.html(cv_wrapped, height=600, scrolling=True)
-
-        with st.expander("Preview Cover Letter"):
-            cl_wrapped = f'<div style="background-color: white; padding: 20px; border-radius: 8px;">{cover_letter_html}</div>'
-            st.components.v1.html(cl_wrapped, height=600, scrolling=True)
+        # The documents are only wrapped and sent to the browser while their preview is open
+        with st.expander("Preview CV", key="preview_generated_cv", on_change="rerun") as cv_preview:
+            if cv_preview.open:
+                cv_wrapped = f'<div style="background-color: white; padding: 20px; border-radius: 8px;">{cv_html}</div>'
+                st.components.v1.html(cv_wrapped, height=600, scrolling=True)
+
+        with st.expander("Preview Cover Letter", key="preview_generated_cover_letter", on_change="rerun") as cl_preview:
+            if cl_preview.open:
+                cl_wrapped = f'<div style="background-color: white; padding: 20px; border-radius: 8px;">{cover_letter_html}</div>'
+                st.components.v1.html(cl_wrapped, height=600, scrolling=True)
+
+        # PDFs are only rendered when a download is actually requested; both documents
+        # render together, so the second download is served from the renderer cache
+        download_col1, download_col2 = st.columns(2)
+        with download_col1:
+            st.download_button(
+                label="📄 Download CV (PDF)",
+                data=lambda: render_application_pdfs(cv_html, cover_letter_html)[0],
+                file_name=st.session_state.cv_pdf_name,
+                mime="application/pdf",
+                use_container_width=True,
+                on_click="ignore"
+            )
+        with download_col2:
+            st.download_button(
+                label="📄 Download Cover Letter (PDF)",
+                data=lambda: render_application_pdfs(cv_html, cover_letter_html)[1],
+                file_name=st.session_state.cl_pdf_name,
+                mime="application/pdf",
+                use_container_width=True,
+                on_click="ignore"
+            )
 
 
 if __name__ == "__main__":
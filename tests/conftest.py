@@ -0,0 +1,78 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import sqlite3
+import uuid
+
+import pytest
+import yaml
+
+from src.database import ApplicationDatabase
+from src.models import UserProfile
+from src.translation_loader import create_translation_loader
+
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="run the slow tests that call the OpenAI API")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: test calls the OpenAI API (skipped unless --runslow)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the LLM-backed tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="calls the OpenAI API; use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def user_profile():
+    """Load the user profile from YAML once per test run (the profile models are frozen)."""
+    with open("templates/user_profile.yaml", "rb") as f:
+        profile_data = yaml.load(f, Loader=YAML_LOADER)
+    return UserProfile(**profile_data)
+
+
+@pytest.fixture(scope="session")
+def translation_loader():
+    """Load the translation loader once per test run."""
+    return create_translation_loader()
+
+
+@pytest.fixture(scope="session")
+def database_template(tmp_path_factory):
+    """Empty application database whose schema is created once per test run."""
+    template_path = tmp_path_factory.mktemp("database") / "template.db"
+    ApplicationDatabase(str(template_path))
+    return template_path
+
+
+@pytest.fixture
+def temp_db(database_template):
+    """
+    Create an in-memory database for testing, copied from the template.
+
+    The shared-cache database lives as long as a connection to it is open,
+    so the fixture opens one for the whole test and hands it to
+    ApplicationDatabase to reuse; the unique name keeps tests from seeing
+    each other's rows.
+    """
+    uri = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    conn = sqlite3.connect(uri, uri=True, cached_statements=256)
+    template = sqlite3.connect(database_template)
+    try:
+        template.backup(conn)
+    finally:
+        template.close()
+    yield ApplicationDatabase(uri, uri=True, connection=conn)
+    conn.close()
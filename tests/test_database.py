@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Tests for the aggregate and query helpers of the application database.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pytest
+
+from src.database import Application, ApplicationDatabase
+
+
+def make_application(company: str, position: str = "Engineer", unmatched_skills=None, **kwargs) -> Application:
+    """Build an application with sensible defaults for query tests."""
+    data = dict(
+        company=company,
+        position=position,
+        matching_rate=0.75,
+        unmatched_skills=unmatched_skills if unmatched_skills is not None else [],
+        matched_skills=["Python"],
+        location="Remote",
+        job_offer_input="offer",
+        application_cost=0.10,
+        language="en"
+    )
+    data.update(kwargs)
+    return Application(**data)
+
+
+class TestSaveApplications:
+    """Test saving several applications in one transaction."""
+
+    def test_save_applications_returns_ids_and_overwrites_duplicates(self, temp_db):
+        """Test IDs come back in order and a repeated company/position overwrites the earlier row."""
+        existing_id = temp_db.save_application(make_application("A"))
+
+        ids = temp_db.save_applications([
+            make_application("A", matching_rate=0.9),
+            make_application("B"),
+            make_application("B", matching_rate=0.5),
+        ])
+
+        assert ids[0] == existing_id
+        assert ids[1] == ids[2]
+        assert temp_db.get_application(existing_id, include_pdfs=False).matching_rate == 0.9
+        assert temp_db.get_application(ids[1], include_pdfs=False).matching_rate == 0.5
+        assert len(temp_db.get_all_applications()) == 2
+
+
+class TestSharedConnection:
+    """Test an ApplicationDatabase reusing a caller-owned connection."""
+
+    def test_connection_is_reused_and_left_open(self, tmp_path):
+        """Test every call runs on the given connection and per-call row factories do not leak."""
+        conn = sqlite3.connect(tmp_path / "shared.db")
+        db = ApplicationDatabase(str(tmp_path / "shared.db"), connection=conn)
+
+        app_id = db.save_application(make_application("A", unmatched_skills=["Rust"]))
+        assert db.get_application(app_id).company == "A"
+        assert db.get_top_unmatched_skills() == [("Rust", 1)]
+        assert conn.execute("SELECT COUNT(*) FROM applications").fetchone() == (1,)
+        conn.close()
+
+    def test_caller_row_factory_is_kept(self, tmp_path):
+        """Test queries do not change the row type of the caller's connection."""
+        conn = sqlite3.connect(tmp_path / "shared.db")
+        conn.row_factory = sqlite3.Row
+        db = ApplicationDatabase(str(tmp_path / "shared.db"), connection=conn)
+
+        app_id = db.save_application(make_application("A"))
+        assert db.get_application(app_id).company == "A"
+        assert conn.row_factory is sqlite3.Row
+        conn.row_factory = None
+        db.get_application(app_id)
+        assert conn.row_factory is None
+        conn.close()
+
+    def test_saves_join_the_caller_transaction(self, tmp_path):
+        """Test saving inside an open transaction leaves committing to the caller."""
+        conn = sqlite3.connect(tmp_path / "shared.db")
+        db = ApplicationDatabase(str(tmp_path / "shared.db"), connection=conn)
+
+        conn.execute("BEGIN")
+        db.save_applications([make_application("A"), make_application("B")])
+        assert conn.in_transaction
+        conn.rollback()
+
+        assert db.get_application_summaries() == []
+        conn.close()
+
+
+class TestUnmatchedSkills:
+    """Test SQL-side aggregation of unmatched skills."""
+
+    def test_top_unmatched_skills_empty(self, temp_db):
+        """Test aggregation with no applications."""
+        assert temp_db.get_top_unmatched_skills() == []
+
+    def test_top_unmatched_skills_counts_and_order(self, temp_db):
+        """Test skills are counted across applications and sorted by frequency."""
+        temp_db.save_application(make_application("A", unmatched_skills=["Rust", "Go"]))
+        temp_db.save_application(make_application("B", unmatched_skills=["Rust", "Kotlin"]))
+        temp_db.save_application(make_application("C", unmatched_skills=["Rust", "Go"]))
+
+        top = temp_db.get_top_unmatched_skills()
+        assert top == [("Rust", 3), ("Go", 2), ("Kotlin", 1)]
+
+    def test_top_unmatched_skills_limit(self, temp_db):
+        """Test the limit bounds the number of returned skills."""
+        temp_db.save_application(make_application("A", unmatched_skills=["A1", "A2", "A3"]))
+        assert len(temp_db.get_top_unmatched_skills(limit=2)) == 2
+
+    def test_top_unmatched_skills_follow_updates_and_deletes(self, temp_db):
+        """Test the running totals track re-saved and deleted applications."""
+        first_id = temp_db.save_application(make_application("A", unmatched_skills=["Rust", "Go"]))
+        temp_db.save_application(make_application("B", unmatched_skills=["Rust"]))
+
+        # Re-saving the same company/position updates the existing row
+        temp_db.save_application(make_application("A", unmatched_skills=["Kotlin"]))
+        assert temp_db.get_top_unmatched_skills() == [("Kotlin", 1), ("Rust", 1)]
+
+        temp_db.delete_application(first_id)
+        assert temp_db.get_top_unmatched_skills() == [("Rust", 1)]
+
+    def test_top_unmatched_skills_backfilled_for_existing_database(self, temp_db):
+        """Test a database created before skill_counts existed gets its totals computed."""
+        temp_db.save_application(make_application("A", unmatched_skills=["Rust", "Go"]))
+        temp_db.save_application(make_application("B", unmatched_skills=["Rust"]))
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            conn.execute("DROP TABLE skill_counts")
+
+        temp_db.init_database()
+        assert temp_db.get_top_unmatched_skills() == [("Rust", 2), ("Go", 1)]
+
+
+class TestPagination:
+    """Test paged retrieval of applications."""
+
+    def test_application_count(self, temp_db):
+        """Test counting applications."""
+        assert temp_db.get_application_count() == 0
+        temp_db.save_application(make_application("A"))
+        temp_db.save_application(make_application("B"))
+        assert temp_db.get_application_count() == 2
+
+    def test_get_applications_pages(self, temp_db):
+        """Test pages are disjoint and together cover all applications."""
+        for company in ["A", "B", "C", "D", "E"]:
+            temp_db.save_application(make_application(company))
+
+        first_page = temp_db.get_applications(limit=2, offset=0)
+        second_page = temp_db.get_applications(limit=2, offset=2)
+        last_page = temp_db.get_applications(limit=2, offset=4)
+
+        assert len(first_page) == 2
+        assert len(second_page) == 2
+        assert len(last_page) == 1
+        ids = {app.id for app in first_page + second_page + last_page}
+        assert len(ids) == 5
+
+    def test_get_applications_without_limit(self, temp_db):
+        """Test omitting the limit returns every application."""
+        for company in ["A", "B", "C"]:
+            temp_db.save_application(make_application(company))
+        assert len(temp_db.get_applications()) == 3
+
+    def test_get_applications_without_pdfs(self, temp_db):
+        """Test listings can skip the PDF blobs while keeping every other field."""
+        app_id = temp_db.save_application(make_application("A", cv_pdf=b"%PDF-cv", cover_letter_pdf=b"%PDF-cl"))
+
+        listed = temp_db.get_applications(include_pdfs=False)[0]
+        assert listed.cv_pdf is None and listed.cover_letter_pdf is None
+        assert listed.company == "A" and listed.matched_skills == ["Python"]
+        assert temp_db.get_pdf_by_id(app_id, "cv") == b"%PDF-cv"
+
+    def test_get_application_without_pdfs_and_availability(self, temp_db):
+        """Test a single application can be loaded without its blobs, which are reported separately."""
+        app_id = temp_db.save_application(make_application("A", cv_pdf=b"%PDF-cv"))
+
+        loaded = temp_db.get_application(app_id, include_pdfs=False)
+        assert loaded.cv_pdf is None and loaded.company == "A"
+        assert temp_db.get_pdf_availability(app_id) == (True, False)
+        assert temp_db.get_pdf_availability(app_id + 1) == (False, False)
+
+    def test_application_summaries_carry_skill_counts(self, temp_db):
+        """Test listing rows expose stored skill counts instead of the skill lists."""
+        temp_db.save_application(make_application("A", unmatched_skills=["Rust", "Go"]))
+
+        summary = temp_db.get_application_summaries()[0]
+        assert summary['company'] == "A"
+        assert summary['matched_count'] == 1
+        assert summary['unmatched_count'] == 2
+        assert isinstance(summary['created_at'], datetime)
+        assert 'matched_skills' not in summary and 'cv_pdf' not in summary
+
+    def test_skill_counts_are_backfilled(self, temp_db):
+        """Test rows written without counts get them on the next initialization."""
+        app_id = temp_db.save_application(make_application("A", unmatched_skills=["Rust", "Go"]))
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            conn.execute("UPDATE applications SET matched_count = NULL, unmatched_count = NULL WHERE id = ?", (app_id,))
+
+        temp_db.init_database()
+        summary = temp_db.get_application_summaries()[0]
+        assert (summary['matched_count'], summary['unmatched_count']) == (1, 2)
+
+    def test_get_applications_filtered_by_company(self, temp_db):
+        """Test the company filter applies to both the page and the count."""
+        temp_db.save_application(make_application("A", position="Backend"))
+        temp_db.save_application(make_application("B", position="Backend"))
+        temp_db.save_application(make_application("A", position="Frontend"))
+
+        assert temp_db.get_application_count(company="A") == 2
+        assert [app.company for app in temp_db.get_applications(company="A")] == ["A", "A"]
+
+    def test_get_applications_min_rate_and_order(self, temp_db):
+        """Test the minimum match rate filter and the SQL ordering."""
+        temp_db.save_application(make_application("A", matching_rate=0.9))
+        temp_db.save_application(make_application("B", matching_rate=0.3))
+        temp_db.save_application(make_application("C", matching_rate=0.6))
+
+        ranked = temp_db.get_applications(min_rate=0.5, order_by="match_desc")
+        assert [app.company for app in ranked] == ["A", "C"]
+        assert temp_db.get_application_count(min_rate=0.5) == 2
+        assert [app.company for app in temp_db.get_applications(order_by="company")] == ["A", "B", "C"]
+
+    def test_get_applications_rejects_unknown_order(self, temp_db):
+        """Test arbitrary ORDER BY input is refused."""
+        with pytest.raises(ValueError):
+            temp_db.get_applications(order_by="company; DROP TABLE applications")
+
+    def test_distinct_companies(self, temp_db):
+        """Test companies are deduplicated and sorted."""
+        for company, position in [("Zeta", "Backend"), ("Acme", "Backend"), ("Zeta", "Frontend"), ("Beta", "Backend")]:
+            temp_db.save_application(make_application(company, position=position))
+        assert temp_db.distinct_companies() == ["Acme", "Beta", "Zeta"]
+
+
+class TestQueryPlans:
+    """Test hot dashboard queries stay index-backed."""
+
+    def test_distinct_companies_uses_covering_index(self, temp_db):
+        """Test the company list is a covering index scan with no temporary sort."""
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            plan = " ".join(row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT DISTINCT company FROM applications ORDER BY company"
+            ))
+
+        assert "COVERING INDEX idx_apps_cov" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestDataVersion:
+    """Test the table fingerprint used for cache invalidation."""
+
+    def test_data_version_changes_on_insert_and_delete(self, temp_db):
+        """Test the version changes whenever rows are added or removed."""
+        empty_version = temp_db.get_data_version()
+        app_id = temp_db.save_application(make_application("A"))
+        inserted_version = temp_db.get_data_version()
+        assert inserted_version != empty_version
+
+        temp_db.delete_application(app_id)
+        assert temp_db.get_data_version() != inserted_version
+
+
+class TestSummarySince:
+    """Test the date-bounded aggregate used for today's metrics."""
+
+    def test_summary_since_excludes_older_applications(self, temp_db):
+        """Test only applications created after the cutoff are summarized."""
+        old_id = temp_db.save_application(make_application("A", application_cost=1.0, matching_rate=0.2))
+        temp_db.save_application(make_application("B", application_cost=0.5, matching_rate=0.8))
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            conn.execute("UPDATE applications SET created_at = '2020-01-01 12:00:00' WHERE id = ?", (old_id,))
+
+        count, total_cost, avg_match = temp_db.get_summary_since(datetime(2021, 1, 1))
+        assert count == 1
+        assert total_cost == pytest.approx(0.5)
+        assert avg_match == pytest.approx(0.8)
+
+    def test_summary_without_start_covers_all_applications(self, temp_db):
+        """Test omitting the start summarizes the whole table."""
+        temp_db.save_application(make_application("A", application_cost=1.0, matching_rate=0.2))
+        temp_db.save_application(make_application("B", application_cost=0.5, matching_rate=0.8))
+
+        count, total_cost, avg_match = temp_db.get_summary_since()
+        assert count == 2
+        assert total_cost == pytest.approx(1.5)
+        assert avg_match == pytest.approx(0.5)
+
+    def test_summary_since_empty(self, temp_db):
+        """Test the summary of an empty range is all zeros."""
+        assert temp_db.get_summary_since(datetime(2021, 1, 1)) == (0, 0.0, 0.0)
+
+    def test_daily_stats_bucket_by_day(self, temp_db):
+        """Test applications are counted and averaged per day from the start onwards."""
+        created_at = {
+            "A": '2020-01-01 12:00:00',
+            "B": '2021-03-01 09:00:00',
+            "C": '2021-03-01 18:30:00',
+            "D": '2021-03-03 08:00:00',
+        }
+        rates = {"A": 0.9, "B": 0.2, "C": 0.6, "D": 0.5}
+        app_ids = {company: temp_db.save_application(make_application(company, matching_rate=rate))
+                   for company, rate in rates.items()}
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            for company, timestamp in created_at.items():
+                conn.execute("UPDATE applications SET created_at = ? WHERE id = ?", (timestamp, app_ids[company]))
+
+        daily = temp_db.get_daily_stats(datetime(2021, 1, 1))
+        assert [(day, count) for day, count, _ in daily] == [('2021-03-01', 2), ('2021-03-03', 1)]
+        assert [avg for _, _, avg in daily] == pytest.approx([0.4, 0.5])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -8,8 +8,10 @@ import sys
 import traceback
 from pathlib import Path
 
-# Add src directory to path for imports
-sys.path.append(str(Path(__file__).parent / "src"))
+import pytest
+
+# Add the project root to path so `src` imports work when run as a script
+sys.path.append(str(Path(__file__).parent.parent))
 
 def test_imports():
     """Test if all required imports work"""
@@ -30,22 +32,36 @@ def test_imports():
 
     return True
 
-def test_playwright_installation():
-    """Test if Playwright browsers are installed"""
-    print("\nTesting Playwright browser installation...")
+def launch_browser(playwright):
+    """Launch Chromium, or return None when it is not installed"""
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            browser.close()
-        print("✅ Playwright chromium browser works")
-        return True
+        return playwright.chromium.launch()
     except Exception as e:
         print(f"❌ Playwright browser test failed: {e}")
         print("Try running: playwright install chromium")
+        return None
+
+@pytest.fixture(scope="module")
+def browser():
+    """Chromium launched once and shared by every test of this module"""
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        if browser is None:
+            pytest.skip("Playwright chromium browser is not installed")
+        yield browser
+        browser.close()
+
+def test_playwright_installation(browser):
+    """Test if Playwright browsers are installed"""
+    print("\nTesting Playwright browser installation...")
+    if browser is None or not browser.is_connected():
+        print("❌ Playwright chromium browser is not available")
         return False
+    print("✅ Playwright chromium browser works")
+    return True
 
-def test_pdf_generation():
+def test_pdf_generation(browser):
     """Test PDF generation with sample HTML"""
     print("\nTesting PDF generation...")
 
@@ -54,26 +70,32 @@ def test_pdf_generation():
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-    def convert_html_to_pdf(html_content: str) -> bytes:
-        """Convert HTML content to PDF bytes using Playwright."""
+    def render(html_content: str):
+        """Load HTML into a new page; the laid-out page can be printed any number of times."""
         logger.info("Starting HTML to PDF conversion")
+        page = browser.new_page()
         try:
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-                page.set_content(html_content)
-                pdf_bytes = page.pdf(
-                    format='A4',
-                    margin={'top': '1cm', 'right': '1cm', 'bottom': '1cm', 'left': '1cm'},
-                    print_background=True
-                )
-                browser.close()
-                logger.info("PDF conversion completed successfully")
-                return pdf_bytes
+            page.set_content(html_content)
+        except Exception:
+            page.close()
+            raise
+        return page
+
+    def to_pdf(page, **options) -> bytes:
+        """Print an already rendered page, overriding the default PDF options."""
+        pdf_options = {
+            'format': 'A4',
+            'margin': {'top': '1cm', 'right': '1cm', 'bottom': '1cm', 'left': '1cm'},
+            'print_background': True,
+            **options
+        }
+        try:
+            pdf_bytes = page.pdf(**pdf_options)
         except Exception as e:
             logger.error(f"PDF conversion failed: {e}")
             raise
+        logger.info("PDF conversion completed successfully")
+        return pdf_bytes
 
     sample_html = """
     <!DOCTYPE html>
@@ -93,9 +115,21 @@ def test_pdf_generation():
     </html>
     """
 
+    # Other page setups are printed from the same layout instead of loading the HTML again
+    variants = {
+        "Letter": {'format': 'Letter'},
+        "A4 without margins": {'margin': {'top': '0', 'right': '0', 'bottom': '0', 'left': '0'}},
+    }
+
     try:
-        pdf_bytes = convert_html_to_pdf(sample_html)
-        print(f"✅ PDF generation successful - Generated {len(pdf_bytes)} bytes")
+        page = render(sample_html)
+        try:
+            pdf_bytes = to_pdf(page)
+            print(f"✅ PDF generation successful - Generated {len(pdf_bytes)} bytes")
+            for name, options in variants.items():
+                print(f"✅ {name} variant generated - {len(to_pdf(page, **options))} bytes")
+        finally:
+            page.close()
         return pdf_bytes
     except Exception as e:
         print(f"❌ PDF generation failed: {e}")
@@ -122,9 +156,8 @@ def test_file_saving(pdf_bytes):
         # Create full file path
         file_path = downloads_path / filename
 
-        # Write the file
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        # Write the file in one call; the bytes are already in memory
+        file_path.write_bytes(content)
 
         logger.info(f"Saved {file_type} to {file_path}")
         return str(file_path)
@@ -176,24 +209,22 @@ def test_template_loading():
     """Test if HTML templates can be loaded"""
     print("\nTesting template loading...")
 
-    template_files = [
-        "templates/cv_template.html",
-        "templates/cover_letter_template.html"
-    ]
+    # Load through the app's own loader, which shares its mtime-keyed read cache
+    from src.template_processor import TemplateProcessor
+    processor = TemplateProcessor()
 
     success = True
-    for template_file in template_files:
-        template_path = Path(template_file)
-        if template_path.exists():
-            try:
-                content = template_path.read_text(encoding='utf-8')
-                print(f"✅ {template_file} loaded successfully ({len(content)} chars)")
-            except Exception as e:
-                print(f"❌ Failed to read {template_file}: {e}")
-                success = False
-        else:
+    for template_name in (processor.cv_template_name, processor.cover_letter_template_name):
+        template_file = f"templates/{template_name}"
+        try:
+            content = processor.load_template(template_name)
+            print(f"✅ {template_file} loaded successfully ({len(content)} chars)")
+        except FileNotFoundError:
             print(f"❌ Template file not found: {template_file}")
             success = False
+        except Exception as e:
+            print(f"❌ Failed to read {template_file}: {e}")
+            success = False
 
     return success
 
@@ -202,25 +233,38 @@ def main():
     print("🧪 Download Functionality Tester")
     print("=" * 50)
 
-    results = {
-        "imports": test_imports(),
-        "playwright": test_playwright_installation(),
-        "templates": test_template_loading(),
-        "permissions": test_directory_permissions(),
-    }
+    results = {"imports": test_imports()}
 
-    # Only test PDF generation if basic requirements are met
-    if results["imports"] and results["playwright"]:
-        pdf_bytes = test_pdf_generation()
-        results["pdf_generation"] = pdf_bytes is not None
+    # One Playwright driver and one browser serve every check below
+    playwright = None
+    browser = None
+    if results["imports"]:
+        from playwright.sync_api import sync_playwright
+        playwright = sync_playwright().start()
+        browser = launch_browser(playwright)
 
-        if results["pdf_generation"]:
-            results["file_saving"] = test_file_saving(pdf_bytes)
+    try:
+        results["playwright"] = test_playwright_installation(browser)
+        results["templates"] = test_template_loading()
+        results["permissions"] = test_directory_permissions()
+
+        # Only test PDF generation if basic requirements are met
+        if results["imports"] and results["playwright"]:
+            pdf_bytes = test_pdf_generation(browser)
+            results["pdf_generation"] = pdf_bytes is not None
+
+            if results["pdf_generation"]:
+                results["file_saving"] = test_file_saving(pdf_bytes)
+            else:
+                results["file_saving"] = False
         else:
+            results["pdf_generation"] = False
             results["file_saving"] = False
-    else:
-        results["pdf_generation"] = False
-        results["file_saving"] = False
+    finally:
+        if browser is not None:
+            browser.close()
+        if playwright is not None:
+            playwright.stop()
 
     # Summary
     print("\n" + "=" * 50)
@@ -3,13 +3,18 @@
 Test script to validate all three modules work together.
 """
 
+import pytest
 import yaml
 from src.models import UserProfile
 from src.job_parser import parse_job_offer
 from src.skills_matcher import match_skills
 from src.project_selector import select_projects
 
+# libyaml-backed loader when available (same safe semantics as yaml.safe_load)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+@pytest.mark.slow
 def test_complete_pipeline():
     """Test the complete pipeline with sample data."""
     print("🧪 Testing AI Job Application System Pipeline")
@@ -52,8 +57,8 @@ def test_complete_pipeline():
 
         # Step 2: Load user profile
         print("\n👤 Step 2: Loading user profile...")
-        with open("templates/user_profile.yaml", "r") as f:
-            profile_data = yaml.safe_load(f)
+        with open("templates/user_profile.yaml", "rb") as f:
+            profile_data = yaml.load(f, Loader=YAML_LOADER)
 
         user_profile = UserProfile(**profile_data)
         print(f"✅ Loaded profile for: {user_profile.personal_info.name}")
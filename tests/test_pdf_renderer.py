@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent PDF renderer.
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from src.pdf_renderer import CONTEXT_OPTIONS, PdfRenderer, _pdf_options, WeasyPrintRenderer, create_pdf_renderer, weasyprint
+
+
+class TestPdfRendererLifecycle:
+    """Test the worker thread lifecycle of the renderer."""
+
+    def test_close_is_idempotent_and_rejects_new_work(self):
+        """Test a closed renderer refuses conversions and can be closed twice."""
+        renderer = PdfRenderer()
+        renderer.close()
+        renderer.close()
+
+        with pytest.raises(RuntimeError):
+            renderer.html_to_pdf("<p>Hello</p>")
+
+    def test_jobs_run_on_a_single_worker_thread(self):
+        """Test every scheduled job runs on the same dedicated thread."""
+        async def thread_name():
+            return threading.current_thread().name
+
+        renderer = PdfRenderer()
+        try:
+            names = {renderer._submit(thread_name()).result() for _ in range(3)}
+        finally:
+            renderer.close()
+
+        assert names == {"pdf-renderer"}
+
+    def test_warm_up_launches_browser_once(self):
+        """Test warming up shares the browser launch and context with later conversions."""
+        launches = []
+        contexts = []
+
+        class FakeChromium:
+            async def launch(self, args, chromium_sandbox):
+                launches.append(args)
+                return FakeBrowser()
+
+        class FakeContext:
+            async def close(self):
+                pass
+
+        class FakeBrowser:
+            def is_connected(self):
+                return True
+
+            async def new_context(self, **options):
+                contexts.append(FakeContext())
+                return contexts[-1]
+
+            async def close(self):
+                pass
+
+        class FakePlaywright:
+            chromium = FakeChromium()
+
+            async def stop(self):
+                pass
+
+        renderer = PdfRenderer()
+        renderer._playwright = FakePlaywright()
+        try:
+            warm_context = renderer.warm_up().result(timeout=5)
+            assert renderer._submit(renderer._get_context()).result(timeout=5) is warm_context
+        finally:
+            renderer.close()
+
+        assert len(launches) == 1
+        assert len(contexts) == 1
+
+    def test_documents_share_one_context_with_a_page_each(self):
+        """Test documents render in separate pages of one context, and every page is closed."""
+        contexts = []
+        pages = []
+
+        class FakePage:
+            closed = False
+
+            async def set_content(self, html_content):
+                self.html_content = html_content
+
+            async def pdf(self, **options):
+                return self.html_content.encode("utf-8")
+
+            async def close(self):
+                self.closed = True
+
+        class FakeContext:
+            closed = False
+
+            async def new_page(self):
+                pages.append(FakePage())
+                return pages[-1]
+
+            async def close(self):
+                self.closed = True
+
+        class FakeBrowser:
+            def is_connected(self):
+                return True
+
+            async def new_context(self, **options):
+                assert options == CONTEXT_OPTIONS
+                contexts.append(FakeContext())
+                return contexts[-1]
+
+            async def close(self):
+                pass
+
+        renderer = PdfRenderer()
+        renderer._browser = FakeBrowser()
+        try:
+            pdfs = renderer.html_to_pdfs([("<p>CV</p>", None), ("<p>Letter</p>", None)])
+            assert renderer.html_to_pdf("<p>Other</p>") == b"<p>Other</p>"
+        finally:
+            renderer.close()
+
+        assert pdfs == [b"<p>CV</p>", b"<p>Letter</p>"]
+        assert len(contexts) == 1
+        assert len(pages) == 3
+        assert all(page.closed for page in pages)
+        assert contexts[0].closed
+
+
+class TestPdfOptions:
+    """Test the page.pdf options chosen per document."""
+
+    def test_backgrounds_are_printed_only_when_the_document_sets_one(self):
+        """Test background painting is skipped for documents without background styles."""
+        assert _pdf_options("<p>Plain text</p>")["print_background"] is False
+        assert _pdf_options('<p style="Background-Color: #eee">Shaded</p>')["print_background"] is True
+        assert _pdf_options('<td bgcolor="#eee">Cell</td>')["print_background"] is True
+
+
+class TestPdfRendererCache:
+    """Test the content-addressed PDF cache."""
+
+    @staticmethod
+    def make_renderer(**options):
+        """Renderer whose browser rendering is replaced by a call counter."""
+        renderer = PdfRenderer(**options)
+        renderer.rendered = []
+
+        async def fake_render_page(html_content):
+            renderer.rendered.append(html_content)
+            return f"%PDF {html_content}".encode("utf-8")
+
+        renderer._render_page = fake_render_page
+        return renderer
+
+    @pytest.fixture
+    def renderer(self):
+        """In-memory cached renderer holding at most two documents."""
+        renderer = self.make_renderer(cache_size=2)
+        yield renderer
+        renderer.close()
+
+    def test_same_html_is_rendered_once(self, renderer):
+        """Test repeated conversions of identical HTML reuse the first PDF."""
+        first = renderer.html_to_pdf("<p>CV</p>")
+        second, other = renderer.html_to_pdfs([("<p>CV</p>", None), ("<p>Letter</p>", None)])
+
+        assert first == second == b"%PDF <p>CV</p>"
+        assert other == b"%PDF <p>Letter</p>"
+        assert renderer.rendered == ["<p>CV</p>", "<p>Letter</p>"]
+
+    def test_cache_hit_still_writes_output_path(self, renderer, tmp_path):
+        """Test a cached PDF is written to the requested file."""
+        renderer.html_to_pdf("<p>CV</p>")
+        output_path = tmp_path / "cv.pdf"
+
+        pdf_bytes = renderer.html_to_pdf("<p>CV</p>", str(output_path))
+
+        assert output_path.read_bytes() == pdf_bytes
+        assert renderer.rendered == ["<p>CV</p>"]
+
+    def test_least_recently_used_entry_is_evicted(self, renderer):
+        """Test the cache keeps at most cache_size documents."""
+        renderer.html_to_pdf("<p>A</p>")
+        renderer.html_to_pdf("<p>B</p>")
+        renderer.html_to_pdf("<p>A</p>")
+        renderer.html_to_pdf("<p>C</p>")
+        renderer.html_to_pdf("<p>A</p>")
+        renderer.html_to_pdf("<p>B</p>")
+
+        assert renderer.rendered == ["<p>A</p>", "<p>B</p>", "<p>C</p>", "<p>B</p>"]
+
+    def test_disk_cache_is_shared_across_renderers(self, tmp_path):
+        """Test a PDF rendered by one process is reused by the next one."""
+        first = self.make_renderer(cache_dir=tmp_path)
+        try:
+            pdf_bytes = first.html_to_pdf("<p>CV</p>")
+        finally:
+            first.close()
+
+        second = self.make_renderer(cache_dir=tmp_path)
+        try:
+            assert second.html_to_pdf("<p>CV</p>") == pdf_bytes
+        finally:
+            second.close()
+
+        assert second.rendered == []
+        assert len(list(tmp_path.glob("*.pdf"))) == 1
+
+    def test_disk_cache_drops_least_recently_used_files(self, tmp_path):
+        """Test the on-disk cache is trimmed to its size budget."""
+        renderer = self.make_renderer(cache_dir=tmp_path, disk_cache_bytes=len(b"%PDF <p>A</p>") * 2)
+        try:
+            renderer.html_to_pdf("<p>A</p>")
+            renderer.html_to_pdf("<p>B</p>")
+            oldest = sorted(tmp_path.glob("*.pdf"), key=lambda path: path.stat().st_mtime_ns)[0]
+            os.utime(oldest, (0, 0))
+            renderer.html_to_pdf("<p>C</p>")
+        finally:
+            renderer.close()
+
+        assert not oldest.exists()
+        assert len(list(tmp_path.glob("*.pdf"))) == 2
+
+
+class TestPdfRendererConcurrency:
+    """Test the limit on documents rendered at the same time."""
+
+    def test_renders_never_exceed_max_pages(self):
+        """Test conversions beyond max_pages wait for a free slot."""
+        renderer = PdfRenderer(max_pages=2)
+        active = []
+        peak = []
+
+        async def fake_render_page(html_content):
+            active.append(html_content)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(html_content)
+            return html_content.encode("utf-8")
+
+        renderer._render_page = fake_render_page
+        try:
+            pdfs = renderer.html_to_pdfs([(f"<p>{i}</p>", None) for i in range(5)])
+        finally:
+            renderer.close()
+
+        assert pdfs == [f"<p>{i}</p>".encode("utf-8") for i in range(5)]
+        assert max(peak) == 2
+
+
+class TestCreatePdfRenderer:
+    """Test the PDF_ENGINE renderer selection."""
+
+    def test_defaults_to_chromium(self, monkeypatch):
+        """Test Chromium is used when no engine is configured."""
+        monkeypatch.delenv("PDF_ENGINE", raising=False)
+        monkeypatch.delenv("PDF_BROWSER_CDP_URL", raising=False)
+        renderer = create_pdf_renderer()
+        try:
+            assert type(renderer) is PdfRenderer
+        finally:
+            renderer.close()
+
+    def test_chromium_attaches_over_cdp_when_configured(self, monkeypatch):
+        """Test PDF_BROWSER_CDP_URL makes the renderer connect instead of launching."""
+        connected = []
+
+        class FakeContext:
+            async def close(self):
+                pass
+
+        class FakeBrowser:
+            def is_connected(self):
+                return True
+
+            async def new_context(self, **options):
+                return FakeContext()
+
+            async def close(self):
+                pass
+
+        class FakeChromium:
+            async def connect_over_cdp(self, endpoint_url):
+                connected.append(endpoint_url)
+                return FakeBrowser()
+
+            async def launch(self, args, chromium_sandbox):
+                raise AssertionError("a shared browser must not be launched")
+
+        class FakePlaywright:
+            chromium = FakeChromium()
+
+            async def stop(self):
+                pass
+
+        monkeypatch.delenv("PDF_ENGINE", raising=False)
+        monkeypatch.setenv("PDF_BROWSER_CDP_URL", "http://localhost:9222")
+        renderer = create_pdf_renderer()
+        renderer._playwright = FakePlaywright()
+        try:
+            renderer.warm_up().result(timeout=5)
+        finally:
+            renderer.close()
+
+        assert connected == ["http://localhost:9222"]
+
+    @pytest.mark.parametrize("setting, sandboxed", [(None, True), ("", True), ("1", False), ("true", False)])
+    def test_sandbox_is_disabled_only_on_request(self, monkeypatch, setting, sandboxed):
+        """Test Chromium keeps its sandbox unless PDF_BROWSER_NO_SANDBOX opts out."""
+        monkeypatch.delenv("PDF_ENGINE", raising=False)
+        if setting is None:
+            monkeypatch.delenv("PDF_BROWSER_NO_SANDBOX", raising=False)
+        else:
+            monkeypatch.setenv("PDF_BROWSER_NO_SANDBOX", setting)
+        launches = []
+
+        class FakeBrowser:
+            def is_connected(self):
+                return True
+
+            async def close(self):
+                pass
+
+        class FakeChromium:
+            async def launch(self, **options):
+                launches.append(options)
+                return FakeBrowser()
+
+        class FakePlaywright:
+            chromium = FakeChromium()
+
+            async def stop(self):
+                pass
+
+        renderer = create_pdf_renderer()
+        renderer._playwright = FakePlaywright()
+        try:
+            renderer._submit(renderer._get_browser()).result(timeout=5)
+        finally:
+            renderer.close()
+
+        assert len(launches) == 1
+        assert launches[0]["chromium_sandbox"] is sandboxed
+        assert "--no-sandbox" not in launches[0]["args"]
+
+    def test_rejects_unknown_engine(self, monkeypatch):
+        """Test a misspelled engine fails loudly instead of silently using Chromium."""
+        monkeypatch.setenv("PDF_ENGINE", "wkhtmltopdf")
+        with pytest.raises(ValueError):
+            create_pdf_renderer()
+
+    @pytest.mark.skipif(weasyprint is not None, reason="WeasyPrint is installed")
+    def test_weasyprint_requires_the_package(self, monkeypatch):
+        """Test selecting WeasyPrint without the package installed raises ImportError."""
+        monkeypatch.setenv("PDF_ENGINE", "weasyprint")
+        with pytest.raises(ImportError):
+            create_pdf_renderer()
+
+    @pytest.mark.skipif(weasyprint is None, reason="WeasyPrint is not installed")
+    def test_weasyprint_renders_without_a_browser(self, monkeypatch, tmp_path):
+        """Test the WeasyPrint engine produces a PDF."""
+        monkeypatch.setenv("PDF_ENGINE", "weasyprint")
+        monkeypatch.setenv("PDF_CACHE_DIR", str(tmp_path))
+        renderer = create_pdf_renderer()
+        try:
+            assert isinstance(renderer, WeasyPrintRenderer)
+            assert renderer.html_to_pdf("<p>Hello</p>").startswith(b"%PDF")
+        finally:
+            renderer.close()
+
+    @pytest.mark.skipif(weasyprint is None, reason="WeasyPrint is not installed")
+    def test_weasyprint_warm_up_does_not_launch_a_browser(self, monkeypatch, tmp_path, caplog):
+        """Test warming up the WeasyPrint engine succeeds without a browser or warning."""
+        monkeypatch.setenv("PDF_ENGINE", "weasyprint")
+        monkeypatch.setenv("PDF_CACHE_DIR", str(tmp_path))
+        renderer = create_pdf_renderer()
+        try:
+            assert renderer.warm_up().result(timeout=5) is None
+        finally:
+            renderer.close()
+
+        assert renderer._playwright is None
+        assert "pre-launch" not in caplog.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,34 +3,35 @@
 Tests for PDF storage and retrieval functionality in the database.
 """
 
+import hashlib
+import sqlite3
+from contextlib import closing
+
 import pytest
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from src.database import Application, ApplicationDatabase
+from src.database import Application
 
 
-@pytest.fixture
-def temp_db(tmp_path):
-    """Create a temporary database for testing."""
-    db_path = str(tmp_path / "test.db")
-    db = ApplicationDatabase(db_path)
-    yield db
-    # Cleanup happens automatically with temp file
+def _pdf_fingerprint(pdf: bytes) -> bytes:
+    """Short digest of a PDF blob, so a failed comparison does not print both documents."""
+    return hashlib.blake2b(pdf, digest_size=16).digest()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_bytes():
-    """Create sample PDF-like bytes for testing."""
+    """Create sample PDF-like bytes for testing (immutable, so built once per run)."""
     # Create a larger sample PDF to ensure storage size > 0
     # Simulate a realistic PDF with more content
-    pdf_content = b"%PDF-1.4\n"
-    pdf_content += b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n" * 10
-    pdf_content += b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n" * 10
-    pdf_content += b"3 0 obj\n<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 4 0 R >> >> /MediaBox [0 0 612 792] /Contents 5 0 R >>\nendobj\n"
-    pdf_content += b"xref\ntrailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n0\n%%EOF"
-    return pdf_content
+    return b"".join([
+        b"%PDF-1.4\n",
+        b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n" * 10,
+        b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n" * 10,
+        b"3 0 obj\n<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 4 0 R >> >> /MediaBox [0 0 612 792] /Contents 5 0 R >>\nendobj\n",
+        b"xref\ntrailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n0\n%%EOF",
+    ])
 
 
 @pytest.fixture
@@ -67,8 +68,8 @@ class TestPDFStorage:
 
         assert retrieved is not None
         assert retrieved.id == original_id
-        assert retrieved.cv_pdf == sample_application.cv_pdf
-        assert retrieved.cover_letter_pdf == sample_application.cover_letter_pdf
+        assert _pdf_fingerprint(retrieved.cv_pdf) == _pdf_fingerprint(sample_application.cv_pdf)
+        assert _pdf_fingerprint(retrieved.cover_letter_pdf) == _pdf_fingerprint(sample_application.cover_letter_pdf)
         assert retrieved.company == "TestCorp"
 
     def test_pdf_persists_after_overwrite(self, temp_db, sample_application, sample_pdf_bytes):
@@ -104,19 +105,25 @@ class TestPDFStorage:
         """Test retrieving CV PDF by application ID."""
         app_id = temp_db.save_application(sample_application)
         cv_pdf = temp_db.get_pdf_by_id(app_id, "cv")
-        assert cv_pdf == sample_application.cv_pdf
+        assert _pdf_fingerprint(cv_pdf) == _pdf_fingerprint(sample_application.cv_pdf)
 
     def test_get_pdf_by_id_cover_letter(self, temp_db, sample_application):
         """Test retrieving cover letter PDF by application ID."""
         app_id = temp_db.save_application(sample_application)
         cl_pdf = temp_db.get_pdf_by_id(app_id, "cover_letter")
-        assert cl_pdf == sample_application.cover_letter_pdf
+        assert _pdf_fingerprint(cl_pdf) == _pdf_fingerprint(sample_application.cover_letter_pdf)
 
     def test_get_pdf_not_found(self, temp_db):
         """Test retrieving PDF for non-existent application."""
         pdf = temp_db.get_pdf_by_id(999, "cv")
         assert pdf is None
 
+    def test_get_pdf_unknown_type(self, temp_db, sample_application):
+        """Test an unknown PDF type is rejected instead of falling back to the cover letter."""
+        app_id = temp_db.save_application(sample_application)
+        with pytest.raises(ValueError, match="Unsupported PDF type"):
+            temp_db.get_pdf_by_id(app_id, "resume")
+
     def test_application_without_pdf(self, temp_db):
         """Test saving and retrieving application without PDFs."""
         app = Application(
@@ -166,6 +173,17 @@ class TestPDFCleanup:
         cleaned = temp_db.cleanup_old_pdfs(days=90)
         assert isinstance(cleaned, int)
 
+    def test_cleanup_removes_pdfs_past_retention(self, temp_db, sample_application):
+        """Test cleanup drops the PDFs of applications older than the retention period."""
+        app_id = temp_db.save_application(sample_application)
+        with closing(sqlite3.connect(temp_db.db_path, uri=temp_db.uri)) as conn, conn:
+            conn.execute("UPDATE applications SET created_at = datetime('now', '-91 days') WHERE id = ?", (app_id,))
+
+        assert temp_db.cleanup_old_pdfs(days=90) == 1
+        assert temp_db.get_pdf_by_id(app_id, "cv") is None
+        assert temp_db.get_pdf_by_id(app_id, "cover_letter") is None
+        assert temp_db.get_application(app_id) is not None
+
     def test_cleanup_preserves_recent_pdfs(self, temp_db, sample_pdf_bytes):
         """Test that cleanup doesn't remove recent PDFs."""
         # Create recent application
@@ -271,9 +289,7 @@ class TestPDFStorageInfo:
             language="en"
         )
 
-        temp_db.save_application(app1)
-        temp_db.save_application(app2)
-        temp_db.save_application(app3)
+        temp_db.save_applications([app1, app2, app3])
 
         info = temp_db.get_pdf_storage_info()
         assert info["total_records"] == 3
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent LLM response cache.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.cost_tracker import generation_cost_tracker, get_cost_tracker, reset_cost_tracker
+from src.models import JobOffer
+from src.response_cache import ResponseCache, make_cache_key, project_selection_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temporary directory."""
+    reset_cost_tracker()
+    return ResponseCache(tmp_path / "responses.db")
+
+
+def make_job_offer() -> JobOffer:
+    """Build a parsed job offer."""
+    return JobOffer(
+        job_title="Python Developer",
+        company_name="TechCorp Inc",
+        skills_required=["Python"],
+        location="Remote",
+        description="We are looking for a Python developer..."
+    )
+
+
+class TestResponseCache:
+    """Test cache hits, misses and keys."""
+
+    def test_cache_key_depends_on_every_part(self):
+        """Test keys are stable and change with any input."""
+        assert make_cache_key("a", "b") == make_cache_key("a", "b")
+        assert make_cache_key("a", "b") != make_cache_key("a", "c")
+        assert make_cache_key("ab") != make_cache_key("a", "b")
+
+    def test_project_selection_key_follows_the_offer(self):
+        """Test the pipeline keys change when the parsed offer changes."""
+        job_offer = make_job_offer()
+        other_offer = job_offer.model_copy(update={"skills_required": ["Python", "Rust"]})
+
+        assert project_selection_key(job_offer, []) == project_selection_key(make_job_offer(), [])
+        assert project_selection_key(job_offer, []) != project_selection_key(other_offer, [])
+
+    def test_cached_call_only_calls_function_on_miss(self, cache):
+        """Test the function runs once and later calls are served from the cache."""
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return make_job_offer()
+
+        first = cache.cached_call("job_parsing", "key", JobOffer, parse)
+        second = cache.cached_call("job_parsing", "key", JobOffer, parse)
+
+        assert len(calls) == 1
+        assert first == second
+        assert get_cost_tracker().cache_hits == ["job_parsing"]
+
+    def test_incompatible_cached_value_is_recomputed(self, cache):
+        """Test a cached value that no longer validates falls back to the function."""
+        cache.set("job_parsing", "key", '{"unexpected": true}')
+
+        result = cache.cached_call("job_parsing", "key", JobOffer, make_job_offer)
+
+        assert result == make_job_offer()
+        assert get_cost_tracker().cache_hits == []
+
+    def test_concurrent_generations_track_their_own_hits(self, cache):
+        """Test each generation records only its own cache hits, which then add up globally."""
+        cache.set("job_parsing", "key", make_job_offer().model_dump_json())
+
+        def generate(hits):
+            with generation_cost_tracker() as tracker:
+                for _ in range(hits):
+                    cache.cached_call("job_parsing", "key", JobOffer, make_job_offer)
+                return len(tracker.cache_hits)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(generate, [1, 2])) == [1, 2]
+        assert len(get_cost_tracker().cache_hits) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
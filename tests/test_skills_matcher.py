@@ -0,0 +1,75 @@
+"""
+Tests for the skills matcher module.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models import JobOffer, MatchedSkills
+from src.skills_matcher import get_unmatched_skills
+
+
+def make_job_offer(skills_required):
+    """Build a job offer requiring the given skills."""
+    return JobOffer(
+        job_title="Python Developer",
+        company_name="TechCorp Inc",
+        skills_required=skills_required,
+        location="Remote",
+        description="We are looking for a Python developer..."
+    )
+
+
+def make_matched_skills(matched):
+    """Build a matching result with the given matched skills."""
+    return MatchedSkills(
+        user_skills=matched,
+        job_skills=matched,
+        matched_skills=matched,
+        relevant_technologies=matched,
+        key_value_contributions=[]
+    )
+
+
+class TestGetUnmatchedSkills:
+    """Test cases for get_unmatched_skills."""
+
+    def test_returns_missing_skills_in_job_order(self):
+        """Test unmatched skills keep the job offer ordering."""
+        job_offer = make_job_offer(["Python", "Rust", "Docker", "Go"])
+        matched = make_matched_skills(["Python", "Docker"])
+
+        assert get_unmatched_skills(job_offer, matched) == ["Rust", "Go"]
+
+    def test_ignores_case(self):
+        """Test a skill matched with different casing is not reported as missing."""
+        job_offer = make_job_offer(["PostgreSQL", "docker"])
+        matched = make_matched_skills(["postgresql", "Docker"])
+
+        assert get_unmatched_skills(job_offer, matched) == []
+
+    def test_removes_duplicates(self):
+        """Test duplicate requirements are only reported once."""
+        job_offer = make_job_offer(["Rust", "rust", "Go"])
+        matched = make_matched_skills([])
+
+        assert get_unmatched_skills(job_offer, matched) == ["Rust", "Go"]
+
+    def test_matched_skill_keys_are_cached(self):
+        """Test the lower-cased matched skill set is built once per result."""
+        matched = make_matched_skills(["Python", "Docker"])
+
+        assert matched.matched_skill_keys == frozenset({"python", "docker"})
+        assert matched.matched_skill_keys is matched.matched_skill_keys
+
+    def test_matched_skills_cannot_be_reassigned(self):
+        """Test the result is frozen, so the cached skill set cannot go stale."""
+        matched = make_matched_skills(["Python"])
+        matched.matched_skill_keys
+
+        with pytest.raises(ValidationError):
+            matched.matched_skills = ["Rust"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
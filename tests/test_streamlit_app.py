@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the Streamlit app pages, run headlessly with Streamlit's AppTest.
+"""
+
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+from streamlit.util import AttributeDictionary
+
+import src.pdf_renderer
+from src.cost_tracker import CostTracker
+from src.database import Application, ApplicationDatabase
+from src.models import JobOffer, MatchedSkills
+
+PROJECT_ROOT = Path(__file__).parent.parent
+APP_PATH = PROJECT_ROOT / "streamlit_app.py"
+
+
+class StubRenderer:
+    """Stands in for the PDF renderer so the app never starts a browser."""
+
+    def warm_up(self):
+        pass
+
+    def html_to_pdf(self, html_content, output_path=None):
+        raise AssertionError("the app tests must not render PDFs")
+
+    def html_to_pdfs(self, documents):
+        raise AssertionError("the app tests must not render PDFs")
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    """Run the app from a scratch directory so it uses its own applications.db."""
+    for name in ("assets", "templates", "translations"):
+        (tmp_path / name).symlink_to(PROJECT_ROOT / name)
+    monkeypatch.chdir(tmp_path)
+    # Keep ~/Downloads/Applications and the renderer's caches inside the scratch directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(src.pdf_renderer, "create_pdf_renderer", StubRenderer)
+    # Cached resources (database handle, listings) would otherwise outlive the directory
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    yield tmp_path
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+
+def make_application(company: str) -> Application:
+    """Build a minimal application for the Historics table."""
+    return Application(
+        company=company,
+        position="Engineer",
+        matching_rate=0.75,
+        unmatched_skills=[],
+        matched_skills=["Python"],
+        location="Remote",
+        job_offer_input="offer",
+        application_cost=0.10,
+        language="en"
+    )
+
+
+def select_row(at: AppTest, row: int) -> None:
+    """
+    Select a row of the Historics table for the next run.
+
+    The browser sends a table's selection back with every rerun for as long as
+    the table keeps its key; AppTest does not, so the selection is set again
+    before each run that should still carry it.
+    """
+    table_key = at.dataframe[0].key
+    at.session_state[table_key] = AttributeDictionary(
+        {"selection": AttributeDictionary({"rows": [row], "columns": [], "cells": []})}
+    )
+
+
+class TestHistoricsPage:
+    """Test the Historics table and its selection."""
+
+    def test_selection_is_dropped_when_the_page_changes(self, app_dir):
+        """Test a selected row does not carry over to the same slot of another page."""
+        db = ApplicationDatabase("applications.db")
+        db.save_applications([make_application(f"Company {index}") for index in range(30)])
+
+        at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+        at.session_state["current_page"] = "📋 Historics"
+        at.run()
+        at.select_slider[0].set_value(25).run()
+
+        select_row(at, 0)
+        at.run()
+        assert not at.exception
+        assert any(button.key == "delete_app" for button in at.button)
+
+        select_row(at, 0)
+        at.number_input[0].set_value(2).run()
+
+        assert not at.exception
+        assert not any(button.key == "delete_app" for button in at.button)
+        assert any("Select a row" in info.value for info in at.info)
+
+
+class TestGeneratePage:
+    """Test the results shown after a generation completes."""
+
+    def test_job_analysis_survives_a_rerun(self, app_dir):
+        """Test the analysis is still shown on the runs after the generation finished."""
+        job_offer = JobOffer(
+            job_title="Engineer", company_name="Acme", skills_required=["Python", "Rust"],
+            location="Remote", description="offer"
+        )
+        matched_skills = MatchedSkills(
+            user_skills=["Python"], job_skills=["Python", "Rust"], matched_skills=["Python"],
+            relevant_technologies=["Python"], key_value_contributions=[]
+        )
+        application = make_application("Acme")
+        application.id = 1
+        application.unmatched_skills = ["Rust"]
+        generation = Future()
+        costs = CostTracker()
+        costs.add_call("gpt-4.1-mini", 1000, 500, "job_parsing")
+        generation.set_result(("<p>cv</p>", "<p>letter</p>", job_offer, matched_skills, application, costs))
+
+        at = AppTest.from_file(str(APP_PATH), default_timeout=60)
+        at.session_state["auto_save_pdfs"] = False
+        at.session_state["generation_future"] = generation
+        at.run()
+        assert not at.exception
+        assert any(header.value == "Job Analysis" for header in at.subheader)
+
+        # Any later interaction reruns the script without the finished generation
+        at.run()
+        assert not at.exception
+        assert any(header.value == "Job Analysis" for header in at.subheader)
+        assert any("Rust" in text.value for text in at.text)
+        assert any(metric.label == "API Calls" and metric.value == "1" for metric in at.metric)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
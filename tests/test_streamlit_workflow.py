@@ -9,34 +9,51 @@ from pathlib import Path
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent / "src"))
 
+def file_size(path: str):
+    """Return the size of a file in bytes, or None if it does not exist."""
+    try:
+        return Path(path).stat().st_size
+    except FileNotFoundError:
+        return None
+
 def test_streamlit_workflow():
     """Test the exact workflow that happens in Streamlit"""
     print("🧪 Testing Streamlit-like workflow...")
 
     # Import required modules
-    from playwright.sync_api import sync_playwright
+    import asyncio
+    from playwright.async_api import async_playwright
     import logging
 
     # Setup logging like in Streamlit app
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-    # Copy exact functions from streamlit_app.py
-    def convert_html_to_pdf(html_content: str) -> bytes:
-        """Convert HTML content to PDF bytes using Playwright."""
-        logger.info("Starting HTML to PDF conversion")
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
-            page.set_content(html_content)
-            pdf_bytes = page.pdf(
+    # Mirrors PdfRenderer.html_to_pdfs in streamlit_app.py: one browser, a page per document
+    async def render_page(browser, html_content: str) -> bytes:
+        """Convert HTML content to PDF bytes in a new page of an already launched browser."""
+        page = await browser.new_page()
+        try:
+            await page.set_content(html_content)
+            return await page.pdf(
                 format='A4',
                 margin={'top': '1cm', 'right': '1cm', 'bottom': '1cm', 'left': '1cm'},
                 print_background=True
             )
-            browser.close()
-            logger.info("PDF conversion completed successfully")
-            return pdf_bytes
+        finally:
+            await page.close()
+
+    async def convert_html_to_pdfs(*documents: str) -> list:
+        """Convert several HTML documents to PDF bytes concurrently using Playwright."""
+        logger.info("Starting HTML to PDF conversion")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            try:
+                pdfs = await asyncio.gather(*(render_page(browser, html) for html in documents))
+            finally:
+                await browser.close()
+        logger.info("PDF conversion completed successfully")
+        return pdfs
 
     def save_file_to_applications(content: bytes, filename: str, file_type: str) -> str:
         """Save file to ~/Downloads/Applications/ directory and return the full path."""
@@ -47,9 +64,8 @@ def test_streamlit_workflow():
         # Create full file path
         file_path = downloads_path / filename
 
-        # Write the file
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        # Write the file in one call; the bytes are already in memory
+        file_path.write_bytes(content)
 
         logger.info(f"Saved {file_type} to {file_path}")
         return str(file_path)
@@ -119,20 +135,15 @@ def test_streamlit_workflow():
     print(f"✅ CL PDF name: {cl_pdf_name}")
 
     # Step 3: Convert to PDF (like in Streamlit app - outside columns)
+    # Both documents render at the same time in one browser, as the app does
     print("\nStep 3: Converting HTML to PDF...")
 
     try:
-        cv_pdf = convert_html_to_pdf(cv_html)
+        cv_pdf, cl_pdf = asyncio.run(convert_html_to_pdfs(cv_html, cover_letter_html))
         print(f"✅ CV PDF conversion successful ({len(cv_pdf)} bytes)")
-    except Exception as e:
-        print(f"❌ CV PDF conversion failed: {e}")
-        return False
-
-    try:
-        cl_pdf = convert_html_to_pdf(cover_letter_html)
         print(f"✅ CL PDF conversion successful ({len(cl_pdf)} bytes)")
     except Exception as e:
-        print(f"❌ CL PDF conversion failed: {e}")
+        print(f"❌ PDF conversion failed: {e}")
         return False
 
     # Step 4: Test individual downloads (like individual buttons)
@@ -163,11 +174,11 @@ def test_streamlit_workflow():
         print(f"✅ Combined CV PDF saved: {cv_saved_path_combined}")
         print(f"✅ Combined CL PDF saved: {cl_saved_path_combined}")
 
-        # Check if files actually exist and have content
-        if Path(cv_saved_path_combined).exists() and Path(cl_saved_path_combined).exists():
-            cv_size = Path(cv_saved_path_combined).stat().st_size
-            cl_size = Path(cl_saved_path_combined).stat().st_size
+        # Check if files actually exist and have content (one stat per file)
+        cv_size = file_size(cv_saved_path_combined)
+        cl_size = file_size(cl_saved_path_combined)
 
+        if cv_size is not None and cl_size is not None:
             if cv_size > 0 and cl_size > 0:
                 print(f"✅ Combined download verification successful")
                 print(f"   CV file size: {cv_size} bytes")
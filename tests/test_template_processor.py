@@ -2,15 +2,17 @@
 Tests for the template processor module.
 """
 
+import os
+
 import pytest
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 from src.template_processor import TemplateProcessor, create_template_processor
 from src.models import JobOffer, MatchedSkills, SelectedProjects, UserProfile, PersonalInfo, Project
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_job_offer():
     """Sample job offer for testing."""
     return JobOffer(
@@ -22,7 +24,7 @@ def sample_job_offer():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user_profile():
     """Sample user profile for testing."""
     return UserProfile(
@@ -37,7 +39,7 @@ def sample_user_profile():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_matched_skills():
     """Sample matched skills for testing."""
     return MatchedSkills(
@@ -49,7 +51,7 @@ def sample_matched_skills():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_selected_projects():
     """Sample selected projects for testing."""
     return SelectedProjects(
@@ -75,7 +77,7 @@ def sample_selected_projects():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def template_processor():
     """Template processor instance for testing."""
     return TemplateProcessor(templates_dir=Path("test_templates"))
@@ -84,27 +86,41 @@ def template_processor():
 class TestTemplateProcessor:
     """Test cases for TemplateProcessor class."""
 
-    def test_load_template_success(self, template_processor):
+    def test_load_template_success(self, tmp_path):
         """Test successful template loading."""
-        mock_content = "<html><body>Test template</body></html>"
+        content = "<html><body>Test template</body></html>"
+        (tmp_path / "test.html").write_text(content, encoding="utf-8")
 
-        with patch("builtins.open", mock_open(read_data=mock_content)):
-            with patch.object(Path, "exists", return_value=True):
-                result = template_processor.load_template("test.html")
-                assert result == mock_content
+        result = TemplateProcessor(templates_dir=tmp_path).load_template("test.html")
+        assert result == content
 
-    def test_load_template_file_not_found(self, template_processor):
+    def test_load_template_file_not_found(self, tmp_path):
         """Test template loading when file doesn't exist."""
-        with patch.object(Path, "exists", return_value=False):
-            with pytest.raises(FileNotFoundError, match="Template not found"):
-                template_processor.load_template("nonexistent.html")
+        with pytest.raises(FileNotFoundError, match="Template not found"):
+            TemplateProcessor(templates_dir=tmp_path).load_template("nonexistent.html")
 
-    def test_load_template_io_error(self, template_processor):
+    def test_load_template_io_error(self, tmp_path):
         """Test template loading with IO error."""
+        (tmp_path / "test.html").write_text("<html></html>", encoding="utf-8")
+        template_processor = TemplateProcessor(templates_dir=tmp_path)
+
         with patch("builtins.open", side_effect=IOError("Permission denied")):
-            with patch.object(Path, "exists", return_value=True):
-                with pytest.raises(IOError, match="Failed to read template"):
-                    template_processor.load_template("test.html")
+            with pytest.raises(IOError, match="Failed to read template"):
+                template_processor.load_template("test.html")
+
+    def test_load_template_rereads_modified_file(self, tmp_path):
+        """Test a cached template is read again once the file changes."""
+        template_path = tmp_path / "cv_template.html"
+        template_path.write_text("<p>v1</p>", encoding="utf-8")
+        processor = TemplateProcessor(templates_dir=tmp_path)
+
+        assert processor.load_template("cv_template.html") == "<p>v1</p>"
+        assert processor.load_template("cv_template.html") == "<p>v1</p>"
+
+        template_path.write_text("<p>v2</p>", encoding="utf-8")
+        os.utime(template_path, ns=(0, template_path.stat().st_mtime_ns + 1_000_000))
+
+        assert processor.load_template("cv_template.html") == "<p>v2</p>"
 
     def test_replace_placeholders_html_comments(self, template_processor):
         """Test placeholder replacement for HTML comments."""
@@ -130,6 +146,14 @@ class TestTemplateProcessor:
         result = template_processor.replace_placeholders(template, replacements)
         assert result == "<html>Software Engineer</html>"
 
+    def test_replace_placeholders_all_forms_in_one_pass(self, template_processor):
+        """Test every placeholder form is replaced and values are inserted literally."""
+        template = "<p><!-- SKILLS_LIST --></p><p>{COMPANY_NAME}</p><p>[GREETING]</p>"
+        replacements = {"SKILLS_LIST": r"C\d, \1", "COMPANY_NAME": "[GREETING]", "GREETING": "Hello"}
+
+        result = template_processor.replace_placeholders(template, replacements)
+        assert result == r"<p>C\d, \1</p><p>[GREETING]</p><p>Hello</p>"
+
     def test_generate_cv_replacements(self, template_processor, sample_job_offer,
                                    sample_user_profile, sample_matched_skills, sample_selected_projects):
         """Test CV replacements generation."""